@@ -1,49 +1,128 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from functools import lru_cache
+from itertools import product, repeat
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 import warnings
 
+import numpy as np
 import pandas as pd
 
 from .param_table import (
     build_c_z,
-    build_bigM,
-    build_yearstep,
-    build_disc_rate,
+    build_all_scalars,
     build_vola2,
     build_vols2,
     build_c_bl,
     build_ub_bl,
-    build_loss_max,
 )
 
 
 REQUIRED_O_COLUMNS = {"param", "indx1", "indx2", "value"}
-DEFAULT_OTHER_CSV = Path(__file__).resolve().parents[2] / "data" / "scenario1" / "other.csv"
-DEFAULT_TIMESERIES_CSV = Path(__file__).resolve().parents[2] / "data" / "scenario1" / "timeseries.csv"
-DEFAULT_NODES_CSV = Path(__file__).resolve().parents[2] / "data" / "scenario1" / "nodes.csv"
-DEFAULT_ARCS_CSV = Path(__file__).resolve().parents[2] / "data" / "scenario1" / "arcs.csv"
-DEFAULT_REGAS_CSV = Path(__file__).resolve().parents[2] / "data" / "scenario1" / "regasification.csv"
-DEFAULT_STORAGE_CSV = Path(__file__).resolve().parents[2] / "data" / "scenario1" / "storage.csv"
+_DEFAULT_DATA_DIR = Path(__file__).resolve().parents[2] / "data" / "scenario1"
+DEFAULT_OTHER_CSV = _DEFAULT_DATA_DIR / "other.csv"
+DEFAULT_TIMESERIES_CSV = _DEFAULT_DATA_DIR / "timeseries.csv"
+DEFAULT_NODES_CSV = _DEFAULT_DATA_DIR / "nodes.csv"
+DEFAULT_ARCS_CSV = _DEFAULT_DATA_DIR / "arcs.csv"
+DEFAULT_REGAS_CSV = _DEFAULT_DATA_DIR / "regasification.csv"
+DEFAULT_STORAGE_CSV = _DEFAULT_DATA_DIR / "storage.csv"
 DEPRECATED_O_WARNING = "DEPRECATED: o.csv detected; please rename to other.csv"
+# Columns (incl. aliases) read by the regas/storage extractors; anything else in those files is not parsed
+# and is absent from the dat_regas/dat_storage frames returned by load_inputs.
+REGAS_CSV_COLUMNS = {"n", "node_id", "f", "fuel", "y", "year", "cal_c", "ub"}
+STORAGE_CSV_COLUMNS = {"n", "node_id", "f", "fuel", "y", "year", "w", "x", "i", "cal_c", "cal_l", "h2-ready"}
+
+try:
+    import pyarrow  # noqa: F401
+
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+
+def _usecols(path: Path, columns: set[str]) -> list[str] | None:
+    """Raw header names whose normalized form is in columns, in file order (None = read everything)."""
+    try:
+        header = [str(col) for col in pd.read_csv(path, nrows=0).columns]
+    except ValueError:
+        return None
+    if len(set(header)) != len(header):
+        return None
+    selected = [col for col in header if col.strip().lower() in columns]
+    return selected or None
+
+
+def _read_csv(path: Path, columns: set[str] | None = None) -> pd.DataFrame:
+    """
+    Read a scenario CSV, using the multi-threaded pyarrow parser when it is installed.
+
+    If columns is given, only header names that normalize into it are parsed. Files that are
+    not valid UTF-8 are re-read with the C engine, which raises UnicodeDecodeError for them.
+    """
+    usecols = _usecols(path, columns) if columns is not None else None
+    if not _HAS_PYARROW:
+        return pd.read_csv(path, usecols=usecols)
+
+    df = pd.read_csv(path, engine="pyarrow", usecols=usecols)
+    text_cols = df.select_dtypes(include="object").columns
+    if any(isinstance(v, bytes) for col in text_cols for v in pd.unique(df[col])):
+        # pyarrow keeps cells that are not valid UTF-8 as bytes; the C engine raises UnicodeDecodeError instead.
+        return pd.read_csv(path, usecols=usecols)
+    # pyarrow yields None for missing text cells; downstream cleaning expects NaN like the C engine.
+    if len(text_cols) > 0:
+        df[text_cols] = df[text_cols].where(df[text_cols].notna(), np.nan)
+    return df
+
+
+def _sorted_values(values: pd.Series) -> list:
+    """Sorted distinct values of a column as plain Python scalars."""
+    return sorted(pd.unique(values).tolist())
+
+
+def _with_defaults(values: dict, keys: Iterable, default: Any) -> dict:
+    """Return a dict covering keys with default, overlaid with the existing values."""
+    full = dict.fromkeys(keys, default)
+    full.update(values)
+    return full
+
+
+def _as_categories(df: pd.DataFrame, cols: Iterable[str], path: Path) -> pd.DataFrame:
+    """
+    Store repeated text label columns as categoricals; extractors re-read them via astype(str).
+
+    Text columns may only hold str labels (or missing cells); anything else raises ValueError naming path.
+    """
+    for col in cols:
+        if col in df.columns and df[col].dtype == object:
+            bad = [v for v in pd.unique(df[col].dropna()) if not isinstance(v, str)]
+            if bad:
+                raise ValueError(f"Non-text labels in column '{col}' of {path}: {bad[:5]}")
+            df[col] = df[col].astype("category")
+    return df
 
 
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
-    out.columns = [str(col).strip().lower() for col in out.columns]
-    return out
+    """Lower-case and strip column names in place; callers pass a freshly read frame."""
+    df.columns = [str(col).strip().lower() for col in df.columns]
+    return df
 
 
 def _resolve_other_csv_path(path: Path) -> Path:
     candidate = Path(path).resolve()
 
     if candidate.is_dir():
+        with os.scandir(candidate) as entries:
+            names = {entry.name for entry in entries}
         other_candidate = candidate / "other.csv"
         legacy_candidate = candidate / "o.csv"
-        if other_candidate.exists():
+        if "other.csv" in names:
             return other_candidate
-        if legacy_candidate.exists():
+        if "o.csv" in names:
             warnings.warn(DEPRECATED_O_WARNING)
             return legacy_candidate
         return other_candidate
@@ -66,7 +145,7 @@ def _resolve_other_csv_path(path: Path) -> Path:
 
 def load_o_csv(path: Path) -> pd.DataFrame:
     """Load other.csv (with legacy o.csv fallback resolved upstream) and validate required columns."""
-    df = _normalize_columns(pd.read_csv(path))
+    df = _normalize_columns(_read_csv(path))
 
     missing = REQUIRED_O_COLUMNS - set(df.columns)
     if missing:
@@ -88,7 +167,7 @@ def load_timeseries_csv(path: Path) -> pd.DataFrame:
     if not path.exists():
         return pd.DataFrame(columns=["y", "h", "scaleup"])
 
-    df = _normalize_columns(pd.read_csv(path))
+    df = _normalize_columns(_read_csv(path))
     rename_map = {"year": "y", "hour": "h", "scale_up": "scaleup"}
     df = df.rename(columns=rename_map)
 
@@ -117,7 +196,7 @@ def load_nodes_csv(path: Path) -> pd.DataFrame:
     if not path.exists():
         return pd.DataFrame(columns=["n", "cn", "nuts2", "rgn", "lat", "lon"])
 
-    df = _normalize_columns(pd.read_csv(path))
+    df = _normalize_columns(_read_csv(path))
     required = {"n", "cn", "nuts2"}
     missing = required - set(df.columns)
     if missing:
@@ -130,7 +209,7 @@ def load_nodes_csv(path: Path) -> pd.DataFrame:
     if "lon" not in df.columns:
         df["lon"] = pd.NA
 
-    return df
+    return _as_categories(df, ["n", "cn", "nuts2", "rgn"], path)
 
 
 def load_arcs_csv(path: Path) -> pd.DataFrame:
@@ -147,7 +226,7 @@ def load_arcs_csv(path: Path) -> pd.DataFrame:
     if not path.exists():
         return pd.DataFrame(columns=["a", "start", "end", "f"])
 
-    df = _normalize_columns(pd.read_csv(path))
+    df = _normalize_columns(_read_csv(path))
     if "e" in df.columns and "f" not in df.columns:
         df = df.rename(columns={"e": "f"})
 
@@ -160,22 +239,33 @@ def load_arcs_csv(path: Path) -> pd.DataFrame:
         if col not in df.columns:
             df[col] = 0.0
 
-    return df
+    return _as_categories(df, ["a", "start", "end", "f"], path)
 
 
 def _hour_columns(df: pd.DataFrame, fixed_cols: set[str]) -> list[str]:
     return sorted([c for c in df.columns if c not in fixed_cols and str(c).isdigit()], key=lambda x: int(x))
 
 
+_FUEL_ALIASES = {
+    "GAS": "G",
+    "NATURAL_GAS": "G",
+    "NATURALGAS": "G",
+    "NG": "G",
+    "HYDROGEN": "H",
+    "H2": "H",
+    "COAL": "C",
+}
+
+
+@lru_cache(maxsize=None, typed=True)
 def _normalize_fuel_label(raw: object) -> str:
     s = str(raw).strip().upper()
-    if s in {"GAS", "NATURAL_GAS", "NATURALGAS", "NG"}:
-        return "G"
-    if s in {"HYDROGEN", "H2"}:
-        return "H"
-    if s in {"COAL"}:
-        return "C"
-    return s
+    return _FUEL_ALIASES.get(s, s)
+
+
+def _normalize_fuel_series(values: pd.Series) -> pd.Series:
+    """_normalize_fuel_label for a whole column (as object, since arc fuels may be categorical)."""
+    return values.astype(object).map(_normalize_fuel_label)
 
 
 def load_consumption_csv(path: Path) -> pd.DataFrame:
@@ -189,7 +279,7 @@ def load_consumption_csv(path: Path) -> pd.DataFrame:
     if not path.exists():
         return pd.DataFrame(columns=["n", "f", "y"])
 
-    df = _normalize_columns(pd.read_csv(path))
+    df = _normalize_columns(_read_csv(path))
     required = {"n", "f", "y"}
     missing = required - set(df.columns)
     if missing:
@@ -214,7 +304,7 @@ def load_production_csv(path: Path) -> pd.DataFrame:
     if not path.exists():
         return pd.DataFrame(columns=["n", "f", "y"])
 
-    df = _normalize_columns(pd.read_csv(path))
+    df = _normalize_columns(_read_csv(path))
     required = {"n", "f", "y"}
     missing = required - set(df.columns)
     if missing:
@@ -237,6 +327,9 @@ def load_regasification_csv(primary_path: Path, legacy_path: Path | None = None)
       - y (or year) [optional, defaults to 2025]
       - cal_c (optional, defaults to 1)
       - ub (optional, defaults to 0)
+
+    Only these columns (and their aliases) are parsed; any other column in the file is dropped
+    from the returned frame.
     """
     warning_messages: list[str] = []
 
@@ -251,7 +344,7 @@ def load_regasification_csv(primary_path: Path, legacy_path: Path | None = None)
         )
         return pd.DataFrame(columns=["n", "f", "y", "cal_c", "ub"]), None, warning_messages
 
-    df = _normalize_columns(pd.read_csv(primary_path))
+    df = _normalize_columns(_read_csv(primary_path, REGAS_CSV_COLUMNS))
     df = df.rename(columns={"node_id": "n", "fuel": "f", "year": "y"})
 
     if not {"n", "f"}.issubset(df.columns):
@@ -279,13 +372,17 @@ def load_storage_csv(path: Path) -> tuple[pd.DataFrame, list[str]]:
       - f (or fuel)
       - y (or year) [optional]
       - w, x, i, cal_c, cal_l [optional -> default 0]
+      - h2-ready [optional]
+
+    Only these columns (and their aliases) are parsed; any other column in the file is dropped
+    from the returned frame.
     """
     warning_messages: list[str] = []
     if not path.exists():
         warning_messages.append(f"Storage file not found: {path}. Using zero/default storage parameters.")
         return pd.DataFrame(columns=["n", "f", "y", "w", "x", "i", "cal_c", "cal_l"]), warning_messages
 
-    df = _normalize_columns(pd.read_csv(path))
+    df = _normalize_columns(_read_csv(path, STORAGE_CSV_COLUMNS))
     df = df.rename(columns={"node_id": "n", "fuel": "f", "year": "y"})
 
     if not {"n", "f"}.issubset(df.columns):
@@ -321,23 +418,25 @@ def _extract_node_structures(
         & (clean["rgn"] != "")
     ]
 
-    n_values = sorted(set(clean["n"].tolist()))
-    cn_values = sorted(set(clean["cn"].tolist()))
-    nuts2_values = sorted(set(clean["nuts2"].tolist()))
-    rgn_values = sorted(set(clean["rgn"].tolist()))
+    n_values = _sorted_values(clean["n"])
+    cn_values = _sorted_values(clean["cn"])
+    nuts2_values = _sorted_values(clean["nuts2"])
+    rgn_values = _sorted_values(clean["rgn"])
 
-    n_in_c = {(r.n, r.cn): 1 for r in clean[["n", "cn"]].itertuples(index=False)}
-    n_in_2 = {(r.n, r.nuts2): 1 for r in clean[["n", "nuts2"]].itertuples(index=False)}
-    n_in_r = {(r.n, r.rgn): 1 for r in clean[["n", "rgn"]].itertuples(index=False)}
+    n_in_c = dict.fromkeys(zip(clean["n"].tolist(), clean["cn"].tolist()), 1)
+    n_in_2 = dict.fromkeys(zip(clean["n"].tolist(), clean["nuts2"].tolist()), 1)
+    n_in_r = dict.fromkeys(zip(clean["n"].tolist(), clean["rgn"].tolist()), 1)
 
     dat_n: dict[tuple[str, str, str, str, str], float] = {}
-    for r in clean[["n", "cn", "nuts2", "rgn", "lat", "lon"]].itertuples(index=False):
-        lat = pd.to_numeric(pd.Series([r.lat]), errors="coerce").iloc[0]
-        lon = pd.to_numeric(pd.Series([r.lon]), errors="coerce").iloc[0]
-        if pd.notna(lat):
-            dat_n[(r.n, r.cn, r.nuts2, r.rgn, "LAT")] = float(lat)
-        if pd.notna(lon):
-            dat_n[(r.n, r.cn, r.nuts2, r.rgn, "LON")] = float(lon)
+    lats = pd.to_numeric(clean["lat"], errors="coerce").astype(float).tolist()
+    lons = pd.to_numeric(clean["lon"], errors="coerce").astype(float).tolist()
+    for n, cn, n2, rgn, lat, lon in zip(
+        clean["n"].tolist(), clean["cn"].tolist(), clean["nuts2"].tolist(), clean["rgn"].tolist(), lats, lons
+    ):
+        if lat == lat:
+            dat_n[(n, cn, n2, rgn, "LAT")] = lat
+        if lon == lon:
+            dat_n[(n, cn, n2, rgn, "LON")] = lon
 
     return n_values, cn_values, nuts2_values, rgn_values, n_in_c, n_in_2, n_in_r, dat_n
 
@@ -350,20 +449,23 @@ def _extract_time_domains(df_t: pd.DataFrame) -> tuple[list[int], list[int], dic
     y_series = pd.to_numeric(df_t["y"], errors="coerce").dropna().astype(int)
     h_series = pd.to_numeric(df_t["h"], errors="coerce").dropna().astype(int)
 
-    y_values = sorted(set(y_series.tolist()))
-    h_values = sorted(set(h_series.tolist()))
+    y_values = _sorted_values(y_series)
+    h_values = _sorted_values(h_series)
+
+    # First strictly positive scaleup per hour (file order), default 1.0.
+    h_num = pd.to_numeric(df_t["h"], errors="coerce")
+    s_num = pd.to_numeric(df_t["scaleup"], errors="coerce")
+    pos = (s_num > 0) & h_num.notna()
+    first_pos = (
+        pd.DataFrame({"h": h_num[pos].astype(float), "s": s_num[pos].astype(float)})
+        .drop_duplicates("h", keep="first")
+        .set_index("h")["s"]
+    )
+    first_map = dict(zip(first_pos.index.tolist(), first_pos.tolist()))
 
     scale_map: dict[int, float] = {}
     for h in h_values:
-        rows = df_t[pd.to_numeric(df_t["h"], errors="coerce") == h]
-        vals = pd.to_numeric(rows["scaleup"], errors="coerce").dropna().tolist()
-        chosen = 1.0
-        for v in vals:
-            fv = float(v)
-            if fv > 0:
-                chosen = fv
-                break
-        scale_map[int(h)] = float(chosen)
+        scale_map[int(h)] = float(first_map.get(float(h), 1.0))
 
     return y_values, h_values, scale_map
 
@@ -381,41 +483,37 @@ def _extract_consumption_data(
     work["n"] = work["n"].astype(str).str.strip()
     work["f"] = work["f"].astype(str).str.strip()
     work["y"] = pd.to_numeric(work["y"], errors="coerce").astype("Int64")
+    work = work[(work["n"] != "") & (work["f"] != "") & work["y"].notna()]
+    if work.empty:
+        return {}, {}, [], [], []
+    work["y"] = work["y"].astype(int)
+
+    # Long form (n,f,y,h,v); later duplicate rows win, matching row-wise dict assignment.
+    long = work.melt(id_vars=["n", "f", "y"], value_vars=hour_cols, var_name="h", value_name="v")
+    long["h"] = long["h"].astype(int)
+    long["v"] = pd.to_numeric(long["v"], errors="coerce").fillna(0.0).astype(float)
+    long = long.drop_duplicates(subset=["n", "f", "y", "h"], keep="last")
+
+    dmd: dict[tuple[str, str, int, int], float] = dict(
+        zip(
+            zip(long["n"].tolist(), long["f"].tolist(), long["y"].tolist(), long["h"].tolist()),
+            long["v"].tolist(),
+        )
+    )
 
-    dmd: dict[tuple[str, str, int, int], float] = {}
-    y_values: set[int] = set()
-    h_values: set[int] = set()
-    f_values: set[str] = set()
-
-    for _, row in work.iterrows():
-        n = str(row["n"]).strip()
-        f = str(row["f"]).strip()
-        y_raw = row["y"]
-        if n == "" or f == "" or pd.isna(y_raw):
-            continue
-        y = int(y_raw)
-        y_values.add(y)
-        f_values.add(f)
-
-        for h_col in hour_cols:
-            h = int(h_col)
-            val = pd.to_numeric(pd.Series([row[h_col]]), errors="coerce").iloc[0]
-            v = 0.0 if pd.isna(val) else float(val)
-            dmd[(n, f, y, h)] = v
-            h_values.add(h)
-
-    node_to_nuts2: dict[str, list[str]] = {}
-    for (n, nuts2), flag in n_in_2.items():
-        if int(flag) == 1:
-            node_to_nuts2.setdefault(n, []).append(nuts2)
-
+    node_to_nuts2 = pd.DataFrame(
+        [(n, nuts2) for (n, nuts2), flag in n_in_2.items() if int(flag) == 1],
+        columns=["n", "nuts2"],
+    )
     dmd2: dict[tuple[str, str, int, int], float] = {}
-    for (n, f, y, h), value in dmd.items():
-        for nuts2 in node_to_nuts2.get(n, []):
-            key = (nuts2, f, y, h)
-            dmd2[key] = float(dmd2.get(key, 0.0) + value)
+    if not node_to_nuts2.empty:
+        agg = long.merge(node_to_nuts2, on="n").groupby(["nuts2", "f", "y", "h"], sort=False)["v"].sum()
+        dmd2 = dict(zip(agg.index.tolist(), agg.astype(float).tolist()))
 
-    return dmd, dmd2, sorted(y_values), sorted(h_values), sorted(f_values)
+    y_values = _sorted_values(work["y"])
+    h_values = _sorted_values(long["h"])
+    f_values = _sorted_values(work["f"])
+    return dmd, dmd2, y_values, h_values, f_values
 
 
 def _extract_arc_data(
@@ -466,29 +564,30 @@ def _extract_arc_data(
     work["a"] = work["a"].astype(str).str.strip()
     work["start"] = work["start"].astype(str).str.strip()
     work["end"] = work["end"].astype(str).str.strip()
-    work["f"] = work["f"].map(_normalize_fuel_label)
+    work["f"] = _normalize_fuel_series(work["f"])
     work = work[(work["a"] != "") & (work["start"] != "") & (work["end"] != "") & (work["f"] != "")]
 
     for col in ["cap", "len", "off", "cal_b", "cal_c", "cal_l", "cal_r", "cal_x", "bidir"]:
         work[col] = pd.to_numeric(work[col], errors="coerce").fillna(0.0)
 
-    dat_o_norm = _normalize_columns(dat_o)
-    dat_o_norm["param"] = dat_o_norm["param"].where(dat_o_norm["param"].notna(), "").astype(str).str.strip().str.lower()
-    dat_o_norm["indx1"] = dat_o_norm["indx1"].where(dat_o_norm["indx1"].notna(), "").astype(str).str.strip().str.upper()
-    dat_o_norm["indx2"] = dat_o_norm["indx2"].where(dat_o_norm["indx2"].notna(), "").astype(str).str.strip().str.upper()
+    dat_o_norm = _normalize_columns(dat_o.copy())
+    dat_o_norm["param"] = dat_o_norm["param"].fillna("").astype(str).str.strip().str.lower()
+    dat_o_norm["indx1"] = dat_o_norm["indx1"].fillna("").astype(str).str.strip().str.upper()
+    dat_o_norm["indx2"] = dat_o_norm["indx2"].fillna("").astype(str).str.strip().str.upper()
     dat_o_norm["indx1"] = dat_o_norm["indx1"].replace({"NAN": "", "NONE": "", "NULL": ""})
     dat_o_norm["indx2"] = dat_o_norm["indx2"].replace({"NAN": "", "NONE": "", "NULL": ""})
     dat_o_norm["value"] = pd.to_numeric(dat_o_norm["value"], errors="coerce").fillna(0.0)
 
+    # First matching row wins, as with the previous row-filter lookup.
+    o_lookup: dict[tuple[str, str, str], float] = {}
+    for key, value in zip(
+        zip(dat_o_norm["param"].tolist(), dat_o_norm["indx1"].tolist(), dat_o_norm["indx2"].tolist()),
+        dat_o_norm["value"].tolist(),
+    ):
+        o_lookup.setdefault(key, float(value))
+
     def _o_value(param: str, indx1: str = "", indx2: str = "", default: float = 0.0) -> float:
-        rows = dat_o_norm[
-            (dat_o_norm["param"] == param.lower())
-            & (dat_o_norm["indx1"] == str(indx1).strip().upper())
-            & (dat_o_norm["indx2"] == str(indx2).strip().upper())
-        ]
-        if rows.empty:
-            return float(default)
-        return float(rows.iloc[0]["value"])
+        return float(o_lookup.get((param.lower(), str(indx1).strip().upper(), str(indx2).strip().upper()), default))
 
     offsh_mult = max(0.0, _o_value("offshmult", "", "", 0.0) - 1.0)
     pipe_len_std = _o_value("pipe", "LEN", "STD", 0.0)
@@ -505,7 +604,7 @@ def _extract_arc_data(
     bidir_fix = _o_value("bidir", "FIX", "", 0.0)
     repurp_var_default = _o_value("repurparc", "", "", 0.0)
 
-    a_values = sorted(set(work["a"].tolist()))
+    a_values = _sorted_values(work["a"])
     a_s: dict[tuple[str, str], int] = {}
     a_e: dict[tuple[str, str], int] = {}
     opp: dict[tuple[str, str], int] = {}
@@ -520,39 +619,54 @@ def _extract_arc_data(
     f_ab: dict[tuple[str, int], float] = {}
     e_a: dict[tuple[str, str], float] = {}
 
-    arc_nodes = sorted(set(work["start"].tolist()) | set(work["end"].tolist()))
-    arc_fuels = sorted(set(work["f"].tolist()))
+    arc_nodes = _sorted_values(pd.concat([work["start"], work["end"]], ignore_index=True))
+    arc_fuels = _sorted_values(work["f"])
     all_fuels = sorted(set(e_values) | set(arc_fuels))
 
+    rows_by_arc: dict[str, pd.DataFrame] = {a: rows_a for a, rows_a in work.groupby("a", sort=False)}
+
     arc_endpoints: dict[str, tuple[str, str]] = {}
     for a in a_values:
-        rows_a = work[work["a"] == a]
-        if rows_a.empty:
+        rows_a = rows_by_arc.get(a)
+        if rows_a is None or rows_a.empty:
             continue
         arc_endpoints[a] = (str(rows_a.iloc[0]["start"]).strip(), str(rows_a.iloc[0]["end"]).strip())
 
-    for ai in a_values:
-        if ai not in arc_endpoints:
-            continue
-        ni, mi = arc_endpoints[ai]
-        for ao in a_values:
-            if ao == ai or ao not in arc_endpoints:
+    arcs_by_endpoints: dict[tuple[str, str], list[str]] = defaultdict(list)
+    for a, endpoints in arc_endpoints.items():
+        arcs_by_endpoints[endpoints].append(a)
+
+    opp_partners: dict[str, list[str]] = defaultdict(list)
+    for ai, (ni, mi) in arc_endpoints.items():
+        for ao in arcs_by_endpoints.get((mi, ni), []):
+            if ao == ai:
                 continue
-            no, mo = arc_endpoints[ao]
-            if ni == mo and mi == no:
-                opp[(ai, ao)] = 1
+            opp[(ai, ao)] = 1
+            opp_partners[ai].append(ao)
 
     for a in a_values:
-        opp_candidates = sorted([ao for (ai, ao), flag in opp.items() if ai == a and int(flag) == 1])
+        opp_candidates = sorted(opp_partners.get(a, []))
         opp_map[a] = opp_candidates[0] if len(opp_candidates) > 0 else ""
 
+    # RepurpArc(e,f) and RepurpArc(Fix,f) do not depend on the arc; resolve them once.
+    y_ints = [int(y) for y in y_values]
+    repurp_fix_by_f = {f: _o_value("repurparc", "FIX", f, 0.0) for f in all_fuels}
+    repurp_var_by_ef: dict[tuple[str, str], float] = {}
+    for e in all_fuels:
+        for f in all_fuels:
+            repurp_var = _o_value("repurparc", e, f, 0.0)
+            if repurp_var <= 0.0:
+                repurp_var = repurp_var_default
+            if str(e).upper() == str(f).upper():
+                repurp_var = 0.0
+            repurp_var_by_ef[(e, f)] = repurp_var
+
     for a in a_values:
-        rows_a = work[work["a"] == a].copy()
-        if rows_a.empty:
+        if a not in arc_endpoints:
             continue
+        rows_a = rows_by_arc[a]
 
-        n_start = str(rows_a.iloc[0]["start"]).strip()
-        n_end = str(rows_a.iloc[0]["end"]).strip()
+        n_start, n_end = arc_endpoints[a]
         a_s[(a, n_start)] = 1
         a_e[(a, n_end)] = 1
 
@@ -564,25 +678,26 @@ def _extract_arc_data(
         cal_b_by_f: dict[str, float] = {}
         cal_r_by_f: dict[str, float] = {}
 
-        for _, row in rows_a.iterrows():
-            f = str(row["f"]).strip()
-            cap_val = max(0.0, float(row["cap"]))
+        arc_rows = rows_a[["f", "cap", "cal_b", "cal_c", "cal_l", "cal_x", "cal_r"]].itertuples(index=False, name=None)
+        for f_raw, cap_raw, cal_b_raw, cal_c_raw, cal_l_raw, cal_x_raw, cal_r_raw in arc_rows:
+            f = str(f_raw).strip()
+            cap_val = max(0.0, float(cap_raw))
 
-            cal_b_raw = float(row["cal_b"])
+            cal_b_raw = float(cal_b_raw)
             cal_b = 1.0 if cal_b_raw <= 0.0 else cal_b_raw
             cal_b_by_f[f] = cal_b
 
-            cal_c_raw = float(row["cal_c"])
+            cal_c_raw = float(cal_c_raw)
             cal_c = 1.0 if cal_c_raw <= 0.0 else cal_c_raw
 
-            cal_l_raw = float(row["cal_l"])
+            cal_l_raw = float(cal_l_raw)
             cal_l = 1.0 if cal_l_raw <= 0.0 else cal_l_raw
 
-            cal_x_raw = float(row["cal_x"])
+            cal_x_raw = float(cal_x_raw)
             cal_x = 1.0 if cal_x_raw <= 0.0 else cal_x_raw
             cal_x_by_f[f] = cal_x
 
-            cal_r_raw = float(row["cal_r"])
+            cal_r_raw = float(cal_r_raw)
             cal_r = 1.0 if cal_r_raw <= 0.0 else cal_r_raw
             cal_r_by_f[f] = cal_r
 
@@ -598,10 +713,10 @@ def _extract_arc_data(
             c_a_val = bf_pipe_e * vola2_e * (len_agg + offsh_mult * off_agg) * cal_c / pipe_len_std
             e_a_val = max(1.0 - float(loss_max), 1.0 - bl_pipe_e * len_agg * cal_l / pipe_len_std)
 
-            e_a[(a, f)] = float(e_a_val)
-            for y in y_values:
-                cap_a[(a, f, int(y))] = float(cap_val)
-                c_a[(a, f, int(y))] = float(c_a_val)
+            e_a[(a, f)] = e_a_val
+            for y in y_ints:
+                cap_a[(a, f, y)] = cap_val
+                c_a[(a, f, y)] = c_a_val
 
         is_bid[a] = 1 if float(rows_a["bidir"].sum()) > 0.0 else 0
 
@@ -618,86 +733,74 @@ def _extract_arc_data(
             cal_b = float(cal_b_by_f.get(f, 1.0))
             c_ab_val = bidir_var_e * (len_agg + off_agg) * cal_b / pipe_len_std / year_step
 
-            for y in y_values:
-                c_ax[(a, f, int(y))] = float(c_ax_val)
-                c_ab[(a, f, int(y))] = float(c_ab_val)
+            for y in y_ints:
+                c_ax[(a, f, y)] = c_ax_val
+                c_ab[(a, f, y)] = c_ab_val
 
         for e in all_fuels:
             cal_r = float(cal_r_by_f.get(e, 1.0))
             for f in all_fuels:
-                repurp_var = _o_value("repurparc", e, f, 0.0)
-                if repurp_var <= 0.0:
-                    repurp_var = repurp_var_default
-                if str(e).upper() == str(f).upper():
-                    repurp_var = 0.0
-
-                repurp_fix = _o_value("repurparc", "FIX", f, 0.0)
-                repurp_fix_val = repurp_fix * cal_r / year_step
-                repurp_var_val = repurp_var * (len_agg + offsh_mult * off_agg) * cal_r / pipe_len_std / year_step
-
-                for y in y_values:
-                    c_ar[(a, e, f, int(y))] = float(repurp_var_val)
-                    f_ar[(a, e, f, int(y))] = float(repurp_fix_val)
-
-        for y in y_values:
-            f_ab[(a, int(y))] = float(bidir_fix / year_step)
-
-    for ai in a_values:
-        for ao in a_values:
-            if int(opp.get((ai, ao), 0)) != 1:
-                continue
-            for f in all_fuels:
-                for y in y_values:
-                    if float(c_a.get((ai, f, int(y)), 0.0)) > 0.0 and float(c_a.get((ao, f, int(y)), 0.0)) <= 1e-5:
-                        c_a[(ao, f, int(y))] = float(c_a[(ai, f, int(y))])
-                        c_ax[(ao, f, int(y))] = float(c_ax.get((ai, f, int(y)), 0.0))
-                        c_ab[(ao, f, int(y))] = float(c_ab.get((ai, f, int(y)), 0.0))
-                        f_ab[(ao, int(y))] = float(f_ab.get((ai, int(y)), 0.0))
-                        e_a[(ao, f)] = float(e_a.get((ai, f), e_a.get((ao, f), 1.0)))
-                        is_bid[ao] = int(is_bid.get(ai, is_bid.get(ao, 0)))
-
-    for ai in a_values:
-        for ao in a_values:
-            if int(opp.get((ai, ao), 0)) != 1:
-                continue
-            for e in all_fuels:
-                for f in all_fuels:
-                    for y in y_values:
-                        src_car = float(c_ar.get((ai, e, f, int(y)), 0.0))
-                        dst_car = float(c_ar.get((ao, e, f, int(y)), 0.0))
-                        src_far = float(f_ar.get((ai, e, f, int(y)), 0.0))
-                        dst_far = float(f_ar.get((ao, e, f, int(y)), 0.0))
-                        if (src_car > 0.0 and dst_car <= 1e-5) or (src_far > 0.0 and dst_far <= 1e-5):
-                            c_ar[(ao, e, f, int(y))] = src_car
-                            f_ar[(ao, e, f, int(y))] = src_far
+                repurp_fix_val = repurp_fix_by_f[f] * cal_r / year_step
+                repurp_var_val = repurp_var_by_ef[(e, f)] * (len_agg + offsh_mult * off_agg) * cal_r / pipe_len_std / year_step
 
-    # Ensure full model domain has defaults for all (a,e[,y]) combinations.
-    for a in a_values:
-        is_bid.setdefault(a, 0)
+                keys = [(a, e, f, y) for y in y_ints]
+                c_ar.update(dict.fromkeys(keys, repurp_var_val))
+                f_ar.update(dict.fromkeys(keys, repurp_fix_val))
+
+        f_ab_val = bidir_fix / year_step
+        for y in y_ints:
+            f_ab[(a, y)] = f_ab_val
+
+    # Opposite-arc propagation walks only the sparse opp pairs, in the same (ai, ao) order as the
+    # GAMS loop: an arc filled from one opposite can feed a later pair, so the order is significant.
+    opp_pairs = sorted((ai, ao) for (ai, ao), flag in opp.items() if int(flag) == 1)
+
+    for ai, ao in opp_pairs:
         for f in all_fuels:
-            e_a.setdefault((a, f), 1.0)
-            for y in y_values:
-                cap_a.setdefault((a, f, int(y)), 0.0)
-                c_a.setdefault((a, f, int(y)), 0.0)
-                c_ax.setdefault((a, f, int(y)), 0.0)
-                c_ab.setdefault((a, f, int(y)), 0.0)
-                f_ab.setdefault((a, int(y)), 0.0)
+            for y in y_ints:
+                if c_a.get((ai, f, y), 0.0) > 0.0 and c_a.get((ao, f, y), 0.0) <= 1e-5:
+                    c_a[(ao, f, y)] = c_a[(ai, f, y)]
+                    c_ax[(ao, f, y)] = c_ax.get((ai, f, y), 0.0)
+                    c_ab[(ao, f, y)] = c_ab.get((ai, f, y), 0.0)
+                    f_ab[(ao, y)] = f_ab.get((ai, y), 0.0)
+                    e_a[(ao, f)] = e_a.get((ai, f), e_a.get((ao, f), 1.0))
+                    is_bid[ao] = int(is_bid.get(ai, is_bid.get(ao, 0)))
+
+    for ai, ao in opp_pairs:
         for e in all_fuels:
             for f in all_fuels:
-                for y in y_values:
-                    c_ar.setdefault((a, e, f, int(y)), 0.0)
-                    f_ar.setdefault((a, e, f, int(y)), 0.0)
+                for y in y_ints:
+                    src_car = c_ar.get((ai, e, f, y), 0.0)
+                    dst_car = c_ar.get((ao, e, f, y), 0.0)
+                    src_far = f_ar.get((ai, e, f, y), 0.0)
+                    dst_far = f_ar.get((ao, e, f, y), 0.0)
+                    if (src_car > 0.0 and dst_car <= 1e-5) or (src_far > 0.0 and dst_far <= 1e-5):
+                        c_ar[(ao, e, f, y)] = src_car
+                        f_ar[(ao, e, f, y)] = src_far
+
+    # Ensure full model domain has defaults for all (a,e[,y]) combinations.
+    is_bid = _with_defaults(is_bid, a_values, 0)
+    e_a = _with_defaults(e_a, product(a_values, all_fuels), 1.0)
+    # Parameters over the same domain share one set of key tuples (update() keeps the existing key objects).
+    aey_keys = list(product(a_values, all_fuels, y_ints))
+    cap_a = _with_defaults(cap_a, aey_keys, 0.0)
+    c_a = _with_defaults(c_a, aey_keys, 0.0)
+    c_ax = _with_defaults(c_ax, aey_keys, 0.0)
+    c_ab = _with_defaults(c_ab, aey_keys, 0.0)
+    if all_fuels:
+        f_ab = _with_defaults(f_ab, product(a_values, y_ints), 0.0)
+    aefy_keys = list(product(a_values, all_fuels, all_fuels, y_ints))
+    c_ar = _with_defaults(c_ar, aefy_keys, 0.0)
+    f_ar = _with_defaults(f_ar, aefy_keys, 0.0)
 
     for a in a_values:
         for e in all_fuels:
-            for y in y_values:
-                c_ar[(a, e, e, int(y))] = 0.0
-                f_ar[(a, e, e, int(y))] = 0.0
+            for y in y_ints:
+                c_ar[(a, e, e, y)] = 0.0
+                f_ar[(a, e, e, y)] = 0.0
 
-    for ai in a_values:
-        for ao in a_values:
-            opp.setdefault((ai, ao), 0)
-        opp_map.setdefault(ai, "")
+    opp = _with_defaults(opp, product(a_values, a_values), 0)
+    opp_map = _with_defaults(opp_map, a_values, "")
 
     return a_values, a_s, a_e, opp, is_bid, opp_map, cap_a, c_a, c_ax, c_ab, c_ar, f_ar, f_ab, e_a, arc_nodes, arc_fuels
 
@@ -719,52 +822,34 @@ def _extract_production_data(
     if "lb" not in work.columns:
         work["lb"] = 0.0
 
-    cap_p: dict[tuple[str, str, int, int], float] = {}
-    c_p: dict[tuple[str, str, int], float] = {}
-    lb_p: dict[tuple[str, str, int, int], float] = {}
-    y_values: set[int] = set()
-    h_values: set[int] = set()
-    f_values: set[str] = set()
-
-    for _, row in work.iterrows():
-        n = str(row["n"]).strip()
-        f = str(row["f"]).strip()
-        y_raw = row["y"]
-        if n == "" or f == "" or pd.isna(y_raw):
-            continue
-        y = int(y_raw)
-        f_values.add(f)
-
-        mc_val = pd.to_numeric(pd.Series([row["mc"]]), errors="coerce").iloc[0]
-        c_p[(n, f, y)] = 0.0 if pd.isna(mc_val) else float(mc_val)
-
-        lb_val = pd.to_numeric(pd.Series([row["lb"]]), errors="coerce").iloc[0]
-        lb_scalar = 0.0 if pd.isna(lb_val) else float(lb_val)
+    work = work[(work["n"] != "") & (work["f"] != "") & work["y"].notna()]
+    if work.empty:
+        return {}, {}, {}, [], [], []
+    work["y"] = work["y"].astype(int)
+    value_cols = ["mc", "lb"] + hour_cols
+    work[value_cols] = work[value_cols].apply(pd.to_numeric, errors="coerce").fillna(0.0).astype(float)
 
-        for h_col in hour_cols:
-            h = int(h_col)
-            cap_val = pd.to_numeric(pd.Series([row[h_col]]), errors="coerce").iloc[0]
-            cap_p[(n, f, y, h)] = 0.0 if pd.isna(cap_val) else float(cap_val)
-            lb_p[(n, f, y, h)] = lb_scalar
-            h_values.add(h)
+    c_p: dict[tuple[str, str, int], float] = dict(
+        zip(zip(work["n"].tolist(), work["f"].tolist(), work["y"].tolist()), work["mc"].tolist())
+    )
 
-    # GAMS parity (selected): c_p(n,e,y)$(ord(y)>2) = dat_p(n,e,'2030','MC')
-    ordered_years = sorted(y_values)
-    if len(ordered_years) >= 3 and 2030 in ordered_years:
-        for n in sorted({key[0] for key in c_p.keys()}):
-            for f in sorted({key[1] for key in c_p.keys() if key[0] == n}):
-                ref_key = (n, f, 2030)
-                if ref_key not in c_p:
-                    continue
-                ref_val = float(c_p[ref_key])
-                for y in ordered_years[2:]:
-                    c_p[(n, f, y)] = ref_val
+    # Long form (n,f,y,lb,h,cap); later duplicate rows win, matching row-wise dict assignment.
+    long = work.melt(id_vars=["n", "f", "y", "lb"], value_vars=hour_cols, var_name="h", value_name="cap")
+    long["h"] = long["h"].astype(int)
+    long = long.drop_duplicates(subset=["n", "f", "y", "h"], keep="last")
+    keys = list(zip(long["n"].tolist(), long["f"].tolist(), long["y"].tolist(), long["h"].tolist()))
 
+    cap_p: dict[tuple[str, str, int, int], float] = dict(zip(keys, long["cap"].tolist()))
     # GAMS parity (selected): lb_p(n,e,y,h) = min(lb_p(n,e,y,h), cap_p(n,e,y,h))
-    for key, cap_val in cap_p.items():
-        lb_p[key] = min(float(lb_p.get(key, 0.0)), float(cap_val))
+    lb_p: dict[tuple[str, str, int, int], float] = dict(
+        zip(keys, np.minimum(long["lb"].to_numpy(), long["cap"].to_numpy()).tolist())
+    )
 
-    return cap_p, c_p, lb_p, sorted(y_values), sorted(h_values), sorted(f_values)
+    # Year-domain parity (c_p 2030 carry-forward) is applied by load_inputs on the full model-year domain.
+    y_values: list[int] = []
+    h_values = _sorted_values(long["h"])
+    f_values = _sorted_values(work["f"])
+    return cap_p, c_p, lb_p, y_values, h_values, f_values
 
 
 def _extract_regas_data(
@@ -787,39 +872,32 @@ def _extract_regas_data(
     # Default c_lr parity: gas=1, non-gas=9999; ub_r default is 0
     c_lr: dict[tuple[str, str], float] = {}
     ub_r: dict[tuple[str, str], float] = {}
-    for n in n_values:
-        for e in e_values:
-            e_norm = _normalize_fuel_label(e)
-            c_lr[(str(n), str(e))] = 1.0 if e_norm == "G" else 9999.0
-            ub_r[(str(n), str(e))] = 0.0
+    c_lr_default = {str(e): 1.0 if _normalize_fuel_label(e) == "G" else 9999.0 for e in e_values}
+    for n in map(str, n_values):
+        for e, c_lr_e in c_lr_default.items():
+            key = (n, e)
+            c_lr[key] = c_lr_e
+            ub_r[key] = 0.0
 
     if df_r.empty:
         return c_lr, ub_r, regas_nodes, regas_fuels
 
     work = df_r.copy()
     work["n"] = work["n"].astype(str).str.strip()
-    work["f"] = work["f"].map(_normalize_fuel_label)
+    work["f"] = _normalize_fuel_series(work["f"])
     work["y"] = pd.to_numeric(work["y"], errors="coerce").fillna(2025).astype(int)
 
-    regas_nodes = sorted(set(work["n"][work["n"] != ""].tolist()))
-    regas_fuels = sorted(set(work["f"][work["f"] != ""].tolist()))
-
-    for _, row in work.iterrows():
-        n = str(row["n"]).strip()
-        f = str(row["f"]).strip()
-        y = int(row["y"])
-        if n == "" or f == "":
-            continue
-        if y != 2025:
-            continue
+    regas_nodes = _sorted_values(work["n"][work["n"] != ""])
+    regas_fuels = _sorted_values(work["f"][work["f"] != ""])
 
-        cal_c_raw = pd.to_numeric(pd.Series([row["cal_c"]]), errors="coerce").iloc[0]
-        cal_c = 1.0 if pd.isna(cal_c_raw) or float(cal_c_raw) <= 0.0 else float(cal_c_raw)
-        ub_raw = pd.to_numeric(pd.Series([row["ub"]]), errors="coerce").iloc[0]
-        ub = 0.0 if pd.isna(ub_raw) else max(0.0, float(ub_raw))
+    sel = work[(work["n"] != "") & (work["f"] != "") & (work["y"] == 2025)]
+    cal_c = pd.to_numeric(sel["cal_c"], errors="coerce").astype(float)
+    cal_c = cal_c.where(cal_c > 0.0, 1.0)
+    ub = pd.to_numeric(sel["ub"], errors="coerce").astype(float).fillna(0.0).clip(lower=0.0)
 
-        c_lr[(n, f)] = cal_c if _normalize_fuel_label(f) == "G" else 9999.0
-        ub_r[(n, f)] = ub
+    keys = list(zip(sel["n"].tolist(), sel["f"].tolist()))
+    c_lr.update(zip(keys, cal_c.where(sel["f"] == "G", 9999.0).tolist()))
+    ub_r.update(zip(keys, ub.tolist()))
 
     return c_lr, ub_r, regas_nodes, regas_fuels
 
@@ -853,82 +931,141 @@ def _extract_storage_data(
       c_we(n,e)=vols2(e)*dat_w(n,e,'cal_c')
       e_w(n,e)=1-0.01*dat_w(n,e,'cal_l')
     """
-    cap_we: dict[tuple[str, str, int], float] = {}
-    cap_wi: dict[tuple[str, str, int], float] = {}
-    cap_ww: dict[tuple[str, str, int], float] = {}
-    c_we: dict[tuple[str, str], float] = {}
-    e_w: dict[tuple[str, str], float] = {}
-    h2_ready: dict[tuple[str, str], float] = {}
-
     stor_nodes: list[str] = []
     stor_fuels: list[str] = []
 
-    sum_scaleup = float(sum(float(scaleup.get(int(h), 1.0)) for h in h_values)) if len(h_values) > 0 else 0.0
+    sum_scaleup = float(sum(map(scaleup.get, map(int, h_values), repeat(1.0)))) if len(h_values) > 0 else 0.0
     vols2_h = float(vols2.get("H", 1.0))
 
-    dat_w_map: dict[tuple[str, str, str], float] = {}
+    # dat_w(n,e,key) as a frame indexed by (n, e); missing columns/rows read as 0.
+    w_columns = {"w": "W", "x": "X", "i": "I", "cal_c": "cal_c", "cal_l": "cal_l", "h2-ready": "H2-ready"}
+    dat_w = pd.DataFrame(
+        {key_name: pd.Series(dtype=float) for key_name in w_columns.values()},
+        index=pd.MultiIndex.from_arrays([[], []], names=["n", "f"]),
+    )
     if not df_s.empty:
         work = df_s.copy()
-        work["n"] = work["n"].where(work["n"].notna(), "").astype(str).str.strip()
-        work["f"] = work["f"].where(work["f"].notna(), "").astype(str).str.strip()
+        work["n"] = work["n"].fillna("").astype(str).str.strip()
+        work["f"] = work["f"].fillna("").astype(str).str.strip()
         work = work[(work["n"] != "") & (work["f"] != "")]
-        work["f"] = work["f"].map(_normalize_fuel_label)
-        stor_nodes = sorted(set(work["n"].tolist()))
-        stor_fuels = sorted(set(work["f"].tolist()))
-
-        for _, row in work.iterrows():
-            n = str(row["n"]).strip()
-            f = str(row["f"]).strip()
-            if n == "" or f == "":
-                continue
-            for key_col, key_name in [
-                ("w", "W"),
-                ("x", "X"),
-                ("i", "I"),
-                ("cal_c", "cal_c"),
-                ("cal_l", "cal_l"),
-                ("h2-ready", "H2-ready"),
-            ]:
-                if key_col not in row.index:
-                    continue
-                raw = pd.to_numeric(pd.Series([row[key_col]]), errors="coerce").iloc[0]
-                val = 0.0 if pd.isna(raw) else float(raw)
-                dat_w_map[(n, f, key_name)] = val
+        work["f"] = _normalize_fuel_series(work["f"])
+        stor_nodes = _sorted_values(work["n"])
+        stor_fuels = _sorted_values(work["f"])
+
+        dat_w = pd.DataFrame(
+            {
+                key_name: (
+                    pd.to_numeric(work[key_col], errors="coerce").astype(float).fillna(0.0)
+                    if key_col in work.columns
+                    else 0.0
+                )
+                for key_col, key_name in w_columns.items()
+            },
+            index=work.index,
+        )
+        dat_w.index = pd.MultiIndex.from_arrays([work["n"], work["f"]], names=["n", "f"])
+        dat_w = dat_w[~dat_w.index.duplicated(keep="last")]
 
     all_nodes = sorted(set(n_values) | set(stor_nodes))
-    for n in all_nodes:
-        for e in e_values:
-            e_norm = _normalize_fuel_label(e)
-            x_raw = float(dat_w_map.get((n, e_norm, "X"), 0.0))
-            i_raw = float(dat_w_map.get((n, e_norm, "I"), 0.0))
-            w_raw = float(dat_w_map.get((n, e_norm, "W"), 0.0))
-
-            if x_raw <= 0.0 and e_norm == "H":
-                x_raw = float(dat_w_map.get((n, "G", "X"), 0.0)) / vols2_h if vols2_h != 0 else 0.0
-            if x_raw <= 0.0 and e_norm == "G":
-                x_raw = float(dat_w_map.get((n, "H", "X"), 0.0)) * vols2_h
-
-            if i_raw <= 0.0 and e_norm == "H":
-                i_raw = float(dat_w_map.get((n, "G", "I"), 0.0)) / vols2_h if vols2_h != 0 else 0.0
-            if i_raw <= 0.0 and e_norm == "G":
-                i_raw = float(dat_w_map.get((n, "H", "I"), 0.0)) * vols2_h
-
-            cal_c_raw = float(dat_w_map.get((n, e_norm, "cal_c"), 0.0))
-            cal_c = 1.0 if cal_c_raw <= 0.0 else cal_c_raw
-            cal_l_raw = float(dat_w_map.get((n, e_norm, "cal_l"), 0.0))
-            cal_l = 1.0 if cal_l_raw <= 0.0 else cal_l_raw
+    # Values depend only on the normalized fuel, so evaluate each (n, e_norm) cell once on a dense grid.
+    e_norms = list(dict.fromkeys(_normalize_fuel_label(e) for e in e_values))
+    y_ints = [int(y) for y in y_values]
+
+    def _grid(fuels: list[str], key_name: str) -> np.ndarray:
+        cells = pd.MultiIndex.from_product([all_nodes, fuels], names=["n", "f"])
+        values = dat_w[key_name].reindex(cells, fill_value=0.0).to_numpy(dtype=float)
+        return values.reshape(len(all_nodes), len(fuels))
+
+    is_h = np.asarray([e == "H" for e in e_norms], dtype=bool)
+    is_g = np.asarray([e == "G" for e in e_norms], dtype=bool)
+
+    def _with_cross_fuel_fallback(key_name: str) -> np.ndarray:
+        raw = _grid(e_norms, key_name)
+        from_g = _grid(["G"], key_name) / vols2_h if vols2_h != 0 else np.zeros((len(all_nodes), 1))
+        from_h = _grid(["H"], key_name) * vols2_h
+        raw = np.where((raw <= 0.0) & is_h, from_g, raw)
+        raw = np.where((raw <= 0.0) & is_g, from_h, raw)
+        return np.where(raw > 0.0, raw, 0.0)
+
+    x_cap = _with_cross_fuel_fallback("X")
+    i_cap = _with_cross_fuel_fallback("I")
+    w_raw = _grid(e_norms, "W")
+    ww_scaled = w_raw * sum_scaleup / 8760.0 if sum_scaleup > 0 else np.zeros_like(w_raw)
+    ww_cap = np.where(ww_scaled > 0.0, ww_scaled, 0.0)
+
+    cal_c = _grid(e_norms, "cal_c")
+    cal_c = np.where(cal_c <= 0.0, 1.0, cal_c)
+    cal_l = _grid(e_norms, "cal_l")
+    cal_l = np.where(cal_l <= 0.0, 1.0, cal_l)
+    vols2_e = np.asarray([vols2.get(e, 1.0) for e in e_norms], dtype=float)
+
+    ne_keys = list(product(all_nodes, e_norms))
+    c_we = dict(zip(ne_keys, (vols2_e * cal_c).ravel().tolist()))
+    e_w = dict(zip(ne_keys, (1.0 - 0.01 * cal_l).ravel().tolist()))
+    h2_ready = dict(zip(ne_keys, _grid(e_norms, "H2-ready").ravel().tolist()))
+
+    # The three capacity dicts share one list of (n, e, y) key tuples and repeat each cell over y.
+    ney_keys = [(n, e, y) for n, e in ne_keys for y in y_ints]
+    n_years = len(y_ints)
+    cap_we = dict(zip(ney_keys, np.repeat(x_cap.ravel(), n_years).tolist()))
+    cap_wi = dict(zip(ney_keys, np.repeat(i_cap.ravel(), n_years).tolist()))
+    cap_ww = dict(zip(ney_keys, np.repeat(ww_cap.ravel(), n_years).tolist()))
 
-            c_we[(n, e_norm)] = float(vols2.get(e_norm, 1.0)) * cal_c
-            e_w[(n, e_norm)] = 1.0 - 0.01 * cal_l
-            h2_ready[(n, e_norm)] = float(dat_w_map.get((n, e_norm, "H2-ready"), 0.0))
+    return cap_we, cap_wi, cap_ww, c_we, e_w, h2_ready, stor_nodes, stor_fuels
 
-            ww_scaled = w_raw * sum_scaleup / 8760.0 if sum_scaleup > 0 else 0.0
-            for y in y_values:
-                cap_we[(n, e_norm, int(y))] = max(0.0, x_raw)
-                cap_wi[(n, e_norm, int(y))] = max(0.0, i_raw)
-                cap_ww[(n, e_norm, int(y))] = max(0.0, ww_scaled)
 
-    return cap_we, cap_wi, cap_ww, c_we, e_w, h2_ready, stor_nodes, stor_fuels
+_INPUT_CACHE: dict[tuple, dict[str, Any]] = {}
+_INPUT_CACHE_SIZE = 4
+
+
+def _input_cache_key(paths: list[Path]) -> tuple:
+    """(path, mtime_ns) for every input file; missing files contribute None."""
+    key = []
+    for path in paths:
+        try:
+            key.append((str(path), path.stat().st_mtime_ns))
+        except OSError:
+            key.append((str(path), None))
+    return tuple(key)
+
+
+def clear_input_cache() -> None:
+    """Drop all cached load_inputs results."""
+    _INPUT_CACHE.clear()
+
+
+def load_all(
+    scenario_dir: Path,
+    *,
+    other_path: Path | None = None,
+    timeseries_path: Path | None = None,
+    nodes_path: Path | None = None,
+    arcs_path: Path | None = None,
+    max_workers: int = 8,
+) -> dict[str, Any]:
+    """
+    Read all scenario CSVs of one scenario directory concurrently.
+
+    The loaders are independent and CSV parsing releases the GIL, so a thread pool overlaps
+    the reads. Paths default to the standard file names in scenario_dir. Results are collected
+    in a fixed order, so the first failing loader raises the same error as a serial load.
+    Returns raw frames keyed like load_inputs; 'regas' and 'storage' hold the loader tuples.
+    """
+    scenario_dir = Path(scenario_dir)
+    tasks = {
+        "dat_o": (load_o_csv, other_path if other_path is not None else _resolve_other_csv_path(scenario_dir)),
+        "dat_t": (load_timeseries_csv, timeseries_path if timeseries_path is not None else scenario_dir / "timeseries.csv"),
+        "dat_nodes": (load_nodes_csv, nodes_path if nodes_path is not None else scenario_dir / "nodes.csv"),
+        "dat_arcs": (load_arcs_csv, arcs_path if arcs_path is not None else scenario_dir / "arcs.csv"),
+        "regas": (load_regasification_csv, scenario_dir / "regasification.csv", scenario_dir / "rega.csv"),
+        "storage": (load_storage_csv, scenario_dir / "storage.csv"),
+        "dat_consumption": (load_consumption_csv, scenario_dir / "consumption.csv"),
+        "dat_production": (load_production_csv, scenario_dir / "production.csv"),
+    }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {key: pool.submit(loader, *args) for key, (loader, *args) in tasks.items()}
+        return {key: future.result() for key, future in futures.items()}
 
 
 def load_inputs(
@@ -938,11 +1075,18 @@ def load_inputs(
     timeseries_path: Path | None = None,
     nodes_path: Path | None = None,
     arcs_path: Path | None = None,
+    use_cache: bool = False,
 ) -> dict[str, Any]:
     """
     Central data-loading entry point.
 
     Extend this function as new CSVs are added so model code stays clean.
+    With use_cache=True, results are cached per process, keyed on the resolved input
+    paths and their modification times (a file rewritten within the filesystem's mtime
+    resolution can return stale data). The cache holds its own deep copy and every call
+    returns a fresh deep copy, so callers may mutate the frames and dicts they receive.
+    dat_regas and dat_storage hold only the columns listed in REGAS_CSV_COLUMNS and
+    STORAGE_CSV_COLUMNS; other columns of those files are not parsed.
     """
     if other_path is not None and o_path is not None:
         raise ValueError("Use only one of 'other_path' or legacy 'o_path'.")
@@ -964,42 +1108,76 @@ def load_inputs(
     else:
         final_a_path = final_o_path.parent / "arcs.csv"
     final_regas_path = final_o_path.parent / "regasification.csv"
-    final_rega_legacy_path = final_o_path.parent / "rega.csv"
     final_storage_path = final_o_path.parent / "storage.csv"
     final_c_path = final_o_path.parent / "consumption.csv"
     final_p_path = final_o_path.parent / "production.csv"
 
-    dat_o = load_o_csv(final_o_path)
-    dat_t = load_timeseries_csv(final_t_path)
-    dat_nodes = load_nodes_csv(final_n_path)
-    dat_arcs = load_arcs_csv(final_a_path)
-    dat_regas, loaded_regas_path, regas_warnings = load_regasification_csv(final_regas_path, final_rega_legacy_path)
-    dat_storage, storage_warnings = load_storage_csv(final_storage_path)
+    cache_key = None
+    if use_cache:
+        cache_key = _input_cache_key(
+            [
+                final_o_path,
+                final_t_path,
+                final_n_path,
+                final_a_path,
+                final_regas_path,
+                final_o_path.parent / "rega.csv",
+                final_storage_path,
+                final_c_path,
+                final_p_path,
+            ]
+        )
+        cached = _INPUT_CACHE.get(cache_key)
+        if cached is not None:
+            for msg in cached["regas_warnings"]:
+                warnings.warn(msg)
+            for msg in cached["storage_warnings"]:
+                warnings.warn(msg)
+            return copy.deepcopy(cached)
+
+    frames = load_all(
+        final_o_path.parent,
+        other_path=final_o_path,
+        timeseries_path=final_t_path,
+        nodes_path=final_n_path,
+        arcs_path=final_a_path,
+    )
+    dat_o = frames["dat_o"]
+    dat_t = frames["dat_t"]
+    dat_nodes = frames["dat_nodes"]
+    dat_arcs = frames["dat_arcs"]
+    dat_regas, loaded_regas_path, regas_warnings = frames["regas"]
+    dat_storage, storage_warnings = frames["storage"]
     for msg in regas_warnings:
         warnings.warn(msg)
     for msg in storage_warnings:
         warnings.warn(msg)
-    dat_consumption = load_consumption_csv(final_c_path)
-    dat_production = load_production_csv(final_p_path)
+    dat_consumption = frames["dat_consumption"]
+    dat_production = frames["dat_production"]
     y_values, h_values, scaleup = _extract_time_domains(dat_t)
     n_values, cn_values, nuts2_values, rgn_values, n_in_c, n_in_2, n_in_r, dat_n = _extract_node_structures(dat_nodes)
     dmd, dmd2, y_dmd, h_dmd, f_dmd = _extract_consumption_data(dat_consumption, n_in_2)
     cap_p, c_p, lb_p, y_prod, h_prod, f_prod = _extract_production_data(dat_production)
     c_z = build_c_z(dat_o)
-    regas_f_raw = [_normalize_fuel_label(v) for v in dat_regas.get("f", pd.Series([], dtype=str)).tolist()] if not dat_regas.empty else []
-    storage_f_raw = [_normalize_fuel_label(v) for v in dat_storage.get("f", pd.Series([], dtype=str)).tolist()] if not dat_storage.empty else []
+    regas_f_raw = _normalize_fuel_series(dat_regas.get("f", pd.Series([], dtype=str))).tolist() if not dat_regas.empty else []
+    storage_f_raw = _normalize_fuel_series(dat_storage.get("f", pd.Series([], dtype=str))).tolist() if not dat_storage.empty else []
     e_values = sorted(set(c_z["e"].astype(str).tolist()) | set(f_dmd) | set(f_prod) | set(regas_f_raw) | set(storage_f_raw))
     c_lr, ub_r, regas_nodes, regas_fuels = _extract_regas_data(dat_regas, n_values=n_values, e_values=e_values)
-    n_values = sorted(set(n_values) | set(regas_nodes))
-    for n in n_values:
-        for e in e_values:
-            c_lr.setdefault((str(n), str(e)), 1.0 if _normalize_fuel_label(e) == "G" else 9999.0)
-            ub_r.setdefault((str(n), str(e)), 0.0)
+    # Node domain accumulates regas, arc and storage nodes; it is only sorted where a step needs the order.
+    node_set = set(n_values) | set(regas_nodes)
+    n_values = sorted(node_set)
+    c_lr_default = {str(e): 1.0 if _normalize_fuel_label(e) == "G" else 9999.0 for e in e_values}
+    ne_keys = list(product([str(n) for n in n_values], c_lr_default))
+    c_lr_full = {key: c_lr_default[key[1]] for key in ne_keys}
+    c_lr_full.update(c_lr)
+    c_lr = c_lr_full
+    ub_r = _with_defaults(ub_r, ne_keys, 0.0)
     final_y_values = sorted(set(y_values) | set(y_dmd) | set(y_prod))
     final_h_values = sorted(set(h_values) | set(h_dmd) | set(h_prod))
 
     vola2_map = build_vola2(dat_o, e_values=e_values)
-    loss_max_value = build_loss_max(dat_o)
+    scalars = build_all_scalars(dat_o, {"bigm": 0.0, "yearstep": 0.0, "discrate": 0.02, "lossmax": 0.0})
+    loss_max_value = scalars["lossmax"]
     a_values, a_s, a_e, opp, is_bid, opp_map, cap_a, c_a, c_ax, c_ab, c_ar, f_ar, f_ab, e_a, arc_nodes, arc_fuels = _extract_arc_data(
         dat_arcs,
         dat_o,
@@ -1008,8 +1186,12 @@ def load_inputs(
         vola2=vola2_map,
         loss_max=loss_max_value,
     )
-    n_values = sorted(set(n_values) | set(arc_nodes))
+    node_set.update(arc_nodes)
     e_values = sorted(set(e_values) | set(arc_fuels))
+    # Extend vola2 to the final fuel domain (same result as rebuilding it): arc-only fuels default to 1.
+    for e in e_values:
+        if str(e).strip() != "":
+            vola2_map.setdefault(str(e).strip(), 1.0)
 
     for h in final_h_values:
         if h not in scaleup:
@@ -1018,31 +1200,24 @@ def load_inputs(
     # GAMS parity (selected): c_p(n,e,y)$(ord(y)>2) = dat_p(n,e,'2030','MC')
     # Apply on full model-year domain (final_y_values), not only rows present in production.csv.
     if len(final_y_values) >= 3 and 2030 in final_y_values:
-        cp_keys = list(c_p.keys())
-        cp_nodes = sorted(set(k[0] for k in cp_keys))
-        cp_fuels = sorted(set(k[1] for k in cp_keys))
-        for n in cp_nodes:
-            for f in cp_fuels:
-                ref_key = (n, f, 2030)
-                if ref_key not in c_p:
-                    continue
-                ref_val = float(c_p[ref_key])
-                for y in final_y_values[2:]:
-                    c_p[(n, f, int(y))] = ref_val
+        cp_ref = sorted(((n, f), float(v)) for (n, f, y), v in c_p.items() if y == 2030)
+        late_years = [int(y) for y in final_y_values[2:]]
+        c_p.update({(n, f, y): ref_val for (n, f), ref_val in cp_ref for y in late_years})
 
     vols2_map = build_vols2(dat_o, e_values=e_values)
     cap_we, cap_wi, cap_ww, c_we, e_w, h2_ready, stor_nodes, stor_fuels = _extract_storage_data(
         dat_storage,
-        n_values=n_values,
+        n_values=list(node_set),
         e_values=e_values,
         y_values=final_y_values,
         h_values=final_h_values,
         scaleup=scaleup,
         vols2=vols2_map,
     )
-    n_values = sorted(set(n_values) | set(stor_nodes))
+    node_set.update(stor_nodes)
+    n_values = sorted(node_set)
 
-    return {
+    loaded = {
         "o_path": final_o_path,
         "other_path": final_o_path,
         "timeseries_path": final_t_path,
@@ -1104,12 +1279,17 @@ def load_inputs(
         "h2_ready": h2_ready,
         "storage_fuels": stor_fuels,
         "c_z": c_z,
-        "vola2": build_vola2(dat_o, e_values=e_values),
+        "vola2": vola2_map,
         "vols2": vols2_map,
         "c_bl": build_c_bl(dat_o, e_values=e_values),
         "ub_bl": build_ub_bl(dat_o, e_values=e_values),
-        "bigM": build_bigM(dat_o),
-        "yearstep": build_yearstep(dat_o),
-        "discRate": build_disc_rate(dat_o),
+        "bigM": scalars["bigm"],
+        "yearstep": scalars["yearstep"],
+        "discRate": scalars["discrate"],
         "lossMax": loss_max_value,
     }
+    if cache_key is not None:
+        while len(_INPUT_CACHE) >= _INPUT_CACHE_SIZE:
+            _INPUT_CACHE.pop(next(iter(_INPUT_CACHE)))
+        _INPUT_CACHE[cache_key] = copy.deepcopy(loaded)
+    return loaded
@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Any, Iterable, Optional
 import sys
 
+import numpy as np
+import pandas as pd
 import pyomo.environ as pyo
 
 from .data_loading import load_inputs
@@ -11,21 +13,36 @@ from .data_loading import load_inputs
 
 # STEP 0: Default input path
 DEFAULT_OTHER_CSV = Path(__file__).resolve().parents[2] / "data" / "scenario5" / "other.csv"
+_NA_TOKENS = frozenset({"nan", "none", "null"})
 
 
 def _clean_list(values: Optional[Iterable], *, keep_empty: bool = False) -> list[str]:
     # Utility: unique_sorted({str(v).strip()}) with optional empty-string filtering.
     if values is None:
         return []
-    cleaned: list[str] = []
-    for value in values:
-        s = "" if value is None else str(value).strip()
-        if s.lower() in ["nan", "none", "null"]:
-            s = ""
-        if s == "" and not keep_empty:
-            continue
-        cleaned.append(s)
-    return sorted(set(cleaned))
+    cleaned = pd.Series(list(values), dtype="string").fillna("").str.strip()
+    cleaned = cleaned.mask(cleaned.str.lower().isin(_NA_TOKENS), "")
+    if not keep_empty:
+        cleaned = cleaned[cleaned != ""]
+    return sorted(cleaned.unique().tolist())
+
+
+def _restrict(values: dict, *domains: Iterable, cast=float) -> dict:
+    # Sparse Param initializer: keep only keys inside the index domains, let default= fill the rest.
+    domain_sets = [set(domain) for domain in domains]
+    if len(domain_sets) == 1:
+        only = domain_sets[0]
+        return {key: cast(value) for key, value in values.items() if key in only}
+    return {
+        key: cast(value)
+        for key, value in values.items()
+        if len(key) == len(domain_sets) and all(part in domain for part, domain in zip(key, domain_sets))
+    }
+
+
+def _pairs(values: dict, *domains: Iterable) -> list:
+    # Keys of a 0/1 map that are set and lie inside the index domains, for sparse pyo.Set members.
+    return sorted(key for key, flag in _restrict(values, *domains, cast=int).items() if flag == 1)
 
 
 def build_base_model_with_cz(
@@ -95,19 +112,24 @@ def build_base_model_with_cz(
     loaded_h2_ready = loaded_inputs.get("h2_ready", {})
 
     # STEP 2: Build set domains
-    z_domain = _clean_list(z_values) or sorted(set(c_z_df["z"].astype(str).tolist()))
-    e_domain = _clean_list(e_values) or _clean_list(loaded_e_values) or sorted(set(c_z_df["e"].astype(str).tolist()))
+    z_domain = _clean_list(z_values) or sorted(c_z_df["z"].astype(str).unique().tolist())
+    e_domain = _clean_list(e_values) or _clean_list(loaded_e_values) or sorted(c_z_df["e"].astype(str).unique().tolist())
 
     model.Z = pyo.Set(initialize=z_domain, ordered=True, doc="Penalty types")
     model.E = pyo.Set(initialize=e_domain, ordered=True, doc="Fuels / energy carriers")
-    model.N = pyo.Set(initialize=_clean_list(node_values) or _clean_list(loaded_n_values), ordered=True, doc="Nodes")
-    model.CN = pyo.Set(initialize=_clean_list(loaded_cn_values), ordered=True, doc="Countries")
-    model.NUTS2 = pyo.Set(initialize=_clean_list(loaded_nuts2_values), ordered=True, doc="NUTS2 regions")
-    model.RGN = pyo.Set(initialize=_clean_list(loaded_rgn_values), ordered=True, doc="Regions")
-    model.A = pyo.Set(initialize=_clean_list(arc_values) or _clean_list(loaded_a_values), ordered=True, doc="Arcs")
+    n_domain = _clean_list(node_values) or _clean_list(loaded_n_values)
+    cn_domain = _clean_list(loaded_cn_values)
+    nuts2_domain = _clean_list(loaded_nuts2_values)
+    rgn_domain = _clean_list(loaded_rgn_values)
+    a_domain = _clean_list(arc_values) or _clean_list(loaded_a_values)
+    model.N = pyo.Set(initialize=n_domain, ordered=True, doc="Nodes")
+    model.CN = pyo.Set(initialize=cn_domain, ordered=True, doc="Countries")
+    model.NUTS2 = pyo.Set(initialize=nuts2_domain, ordered=True, doc="NUTS2 regions")
+    model.RGN = pyo.Set(initialize=rgn_domain, ordered=True, doc="Regions")
+    model.A = pyo.Set(initialize=a_domain, ordered=True, doc="Arcs")
 
-    final_y_values = sorted(set((list(y_values) if y_values is not None else loaded_y_values)))
-    final_h_values = sorted(set((list(h_values) if h_values is not None else loaded_h_values)))
+    final_y_values = sorted({int(y) for y in (y_values if y_values is not None else loaded_y_values)})
+    final_h_values = sorted({int(h) for h in (h_values if h_values is not None else loaded_h_values)})
     model.Y = pyo.Set(initialize=final_y_values, ordered=True, doc="Planning years")
     model.H = pyo.Set(initialize=final_h_values, ordered=True, doc="Operational hours")
 
@@ -119,11 +141,16 @@ def build_base_model_with_cz(
     # dmd(n,e,y,h), dmd2(g,e,y,h), cap_p(n,e,y,h), lb_p(n,e,y,h), c_p(n,e,y).
     # c_lr(n,e): regasification unit cost, ub_r(n,e): regasification hourly upper bound.
     # cap_we/cap_wi/cap_ww, c_we, e_w: storage parameters (Sheet-W subset).
-    c_z_map = {(str(r.z), str(r.e)): float(r.c_z) for r in c_z_df.itertuples(index=False)}
+    c_z_map = dict(
+        zip(
+            zip(c_z_df["z"].astype(str).tolist(), c_z_df["e"].astype(str).tolist()),
+            c_z_df["c_z"].astype(float).tolist(),
+        )
+    )
     model.c_z = pyo.Param(
         model.Z,
         model.E,
-        initialize=lambda mm, z, e: float(c_z_map.get((z, e), 0.0)),
+        initialize=_restrict(c_z_map, z_domain, e_domain),
         default=0.0,
         mutable=False,
         doc="Feasibility penalty by (z,e)",
@@ -131,7 +158,7 @@ def build_base_model_with_cz(
     model.c_bl = pyo.Param(
         model.E,
         model.E,
-        initialize=lambda mm, e, f: float(c_bl_map.get((str(e), str(f)), 0.0)),
+        initialize=_restrict(c_bl_map, e_domain, e_domain),
         default=0.0,
         mutable=False,
         doc="Blending cost c_bl(e,f)",
@@ -139,21 +166,21 @@ def build_base_model_with_cz(
     model.ub_bl = pyo.Param(
         model.E,
         model.E,
-        initialize=lambda mm, e, f: float(ub_bl_map.get((str(e), str(f)), 0.0)),
+        initialize=_restrict(ub_bl_map, e_domain, e_domain),
         default=0.0,
         mutable=False,
         doc="Blending upper limit ub_bl(e,f)",
     )
     model.vola2 = pyo.Param(
         model.E,
-        initialize=lambda mm, e: float(vola2_map.get(str(e), 1.0)),
+        initialize=_restrict(vola2_map, e_domain),
         default=1.0,
         mutable=False,
         doc="Energy to arc-volume conversion, relative to gas",
     )
     model.vols2 = pyo.Param(
         model.E,
-        initialize=lambda mm, e: float(vols2_map.get(str(e), 1.0)),
+        initialize=_restrict(vols2_map, e_domain),
         default=1.0,
         mutable=False,
         doc="Energy to storage-volume conversion, relative to gas",
@@ -164,181 +191,132 @@ def build_base_model_with_cz(
     model.lossMax = pyo.Param(initialize=float(loss_max_value), mutable=False, doc="Maximum loss scalar")
 
     y_order = list(model.Y)
-    y_pos = {y: idx for idx, y in enumerate(y_order)}
     y_last = y_order[-1] if len(y_order) > 0 else None
+    r_values = 1.0 / np.power(1.0 + float(discrate_value), float(yearstep_value) * np.arange(len(y_order)))
     model.r = pyo.Param(
         model.Y,
-        initialize=lambda mm, y: float(1.0 / pow(1.0 + pyo.value(mm.discRate), pyo.value(mm.yearstep) * y_pos[y])),
+        initialize=dict(zip(y_order, r_values.tolist())),
         default=1.0,
         mutable=False,
         doc="Discount factor by year: 1/(1+DiscRate)^(YearStep*(ord(y)-1))",
     )
     model.EOH = pyo.Param(
         model.Y,
-        initialize=lambda mm, y: 3.0 if (y_last is not None and int(y) == int(y_last)) else 1.0,
+        initialize={y: 3.0 if y == y_last else 1.0 for y in y_order},
         default=1.0,
         mutable=False,
         doc="End-of-horizon correction EOH(y)",
     )
-    model.ypred = pyo.Param(
-        model.Y,
-        model.Y,
-        initialize=lambda mm, y2, y: int(y_pos[y] - y_pos[y2] == 1),
-        default=0,
-        mutable=False,
-        doc="Immediate predecessor mapping ypred(y2,y)",
-    )
-    model.yscai = pyo.Param(
-        model.Y,
-        model.Y,
-        initialize=lambda mm, y2, y: int(y_pos[y] <= y_pos[y2]),
-        default=0,
-        mutable=False,
-        doc="Successor mapping yscai(y2,y)",
-    )
     model.scaleUp = pyo.Param(
         model.H,
-        initialize=lambda mm, h: float(loaded_scaleup.get(int(h), 1.0)),
+        initialize={h: float(loaded_scaleup.get(h, 1.0)) for h in final_h_values},
         default=1.0,
         mutable=False,
         doc="Representative-hour scaling factor",
     )
-    model.n_in_c = pyo.Param(
-        model.N,
-        model.CN,
-        initialize=lambda mm, n, c: int(loaded_n_in_c.get((str(n), str(c)), 0)),
-        default=0,
-        mutable=False,
-        doc="Node in country mapping",
-    )
-    model.n_in_2 = pyo.Param(
-        model.N,
-        model.NUTS2,
-        initialize=lambda mm, n, g: int(loaded_n_in_2.get((str(n), str(g)), 0)),
-        default=0,
-        mutable=False,
-        doc="Node in NUTS2 mapping",
-    )
-    model.n_in_r = pyo.Param(
-        model.N,
-        model.RGN,
-        initialize=lambda mm, n, r: int(loaded_n_in_r.get((str(n), str(r)), 0)),
-        default=0,
-        mutable=False,
-        doc="Node in region mapping",
-    )
-    model.a_s = pyo.Param(
-        model.A,
-        model.N,
-        initialize=lambda mm, a, n: int(loaded_a_s.get((str(a), str(n)), 0)),
-        default=0,
-        mutable=False,
-        doc="Arc-start incidence a_s(a,n)",
-    )
-    model.a_e = pyo.Param(
-        model.A,
-        model.N,
-        initialize=lambda mm, a, n: int(loaded_a_e.get((str(a), str(n)), 0)),
-        default=0,
-        mutable=False,
-        doc="Arc-end incidence a_e(a,n)",
-    )
-    model.opp = pyo.Param(
-        model.A,
-        model.A,
-        initialize=lambda mm, ai, ao: int(loaded_opp.get((str(ai), str(ao)), 0)),
-        default=0,
-        mutable=False,
-        doc="Opposite-arc mapping opp(ai,ao)",
-    )
+    # Node-membership and arc-incidence maps are 0/1 and mostly zero: keep only the pairs that are set.
+    n_in_2_pairs = _pairs(loaded_n_in_2, n_domain, nuts2_domain)
+    a_s_pairs = _pairs(loaded_a_s, a_domain, n_domain)
+    a_e_pairs = _pairs(loaded_a_e, a_domain, n_domain)
+    opp_pairs = _pairs(loaded_opp, a_domain, a_domain)
+    model.N_IN_C = pyo.Set(
+        within=model.N * model.CN,
+        initialize=_pairs(loaded_n_in_c, n_domain, cn_domain),
+        ordered=True,
+        doc="Node in country pairs n_in_c(n,c)",
+    )
+    model.N_IN_2 = pyo.Set(within=model.N * model.NUTS2, initialize=n_in_2_pairs, ordered=True, doc="Node in NUTS2 pairs n_in_2(n,g)")
+    model.N_IN_R = pyo.Set(
+        within=model.N * model.RGN,
+        initialize=_pairs(loaded_n_in_r, n_domain, rgn_domain),
+        ordered=True,
+        doc="Node in region pairs n_in_r(n,r)",
+    )
+    model.A_S = pyo.Set(within=model.A * model.N, initialize=a_s_pairs, ordered=True, doc="Arc-start incidence a_s(a,n)")
+    model.A_E = pyo.Set(within=model.A * model.N, initialize=a_e_pairs, ordered=True, doc="Arc-end incidence a_e(a,n)")
+    model.OPP_PAIRS = pyo.Set(within=model.A * model.A, initialize=opp_pairs, ordered=True, doc="Opposite-arc pairs opp(ai,ao)")
+    # Reverse adjacency for the balance rules, in set order: arcs leaving/entering n, nodes inside g.
+    a_rank = {a: idx for idx, a in enumerate(a_domain)}
+    n_rank = {n: idx for idx, n in enumerate(n_domain)}
+    arcs_out: dict[str, list[str]] = {}
+    for a, n in sorted(a_s_pairs, key=lambda pair: a_rank[pair[0]]):
+        arcs_out.setdefault(n, []).append(a)
+    arcs_in: dict[str, list[str]] = {}
+    for a, n in sorted(a_e_pairs, key=lambda pair: a_rank[pair[0]]):
+        arcs_in.setdefault(n, []).append(a)
+    nodes_in_2: dict[str, list[str]] = {}
+    for n, g in sorted(n_in_2_pairs, key=lambda pair: n_rank[pair[0]]):
+        nodes_in_2.setdefault(g, []).append(n)
+    is_bid_init = _restrict(loaded_is_bid, a_domain, cast=int)
     model.is_bid = pyo.Param(
         model.A,
-        initialize=lambda mm, a: int(loaded_is_bid.get(str(a), 0)),
+        initialize=is_bid_init,
         default=0,
         mutable=False,
         doc="Arc already bidirectional flag is_bid(a)",
     )
+    bid_arcs = {a for a, flag in is_bid_init.items() if flag == 1}
     model.opp_arc = pyo.Param(
         model.A,
-        initialize=lambda mm, a: str(loaded_opp_map.get(str(a), "")),
+        initialize=_restrict(loaded_opp_map, a_domain, cast=str),
         default="",
         mutable=False,
         within=pyo.Any,
         doc="Representative opposite arc id for reporting",
     )
-    model.is_h = pyo.Param(
-        model.E,
-        initialize=lambda mm, e: int(str(e).upper() == "H"),
-        default=0,
-        mutable=False,
-        doc="Fuel classifier: hydrogen",
-    )
-    model.is_g = pyo.Param(
-        model.E,
-        initialize=lambda mm, e: int(str(e).upper() == "G"),
-        default=0,
-        mutable=False,
-        doc="Fuel classifier: gas",
-    )
-    model.not_h = pyo.Param(
-        model.E,
-        initialize=lambda mm, e: 1 - int(str(e).upper() == "H"),
-        default=1,
-        mutable=False,
-        doc="Fuel classifier: not hydrogen",
-    )
-    model.not_g = pyo.Param(
-        model.E,
-        initialize=lambda mm, e: 1 - int(str(e).upper() == "G"),
-        default=1,
-        mutable=False,
-        doc="Fuel classifier: not gas",
-    )
+    h_fuels = {e for e in e_domain if e.upper() == "H"}
+    g_fuels = {e for e in e_domain if e.upper() == "G"}
+    dmd_init = _restrict(loaded_dmd, n_domain, e_domain, final_y_values, final_h_values)
     model.dmd = pyo.Param(
         model.N,
         model.E,
         model.Y,
         model.H,
-        initialize=lambda mm, n, e, y, h: float(loaded_dmd.get((str(n), str(e), int(y), int(h)), 0.0)),
+        initialize=dmd_init,
         default=0.0,
         mutable=False,
         doc="Demand dmd(n,e,y,h) loaded directly from consumption.csv",
     )
+    dmd_pos = frozenset(idx for idx, v in dmd_init.items() if v > 0.0)
+    dmd2_init = _restrict(loaded_dmd2, nuts2_domain, e_domain, final_y_values, final_h_values)
     model.dmd2 = pyo.Param(
         model.NUTS2,
         model.E,
         model.Y,
         model.H,
-        initialize=lambda mm, g, e, y, h: float(loaded_dmd2.get((str(g), str(e), int(y), int(h)), 0.0)),
+        initialize=dmd2_init,
         default=0.0,
         mutable=False,
         doc="NUTS2 demand dmd2(nuts2,e,y,h), aggregated from dmd via n_in_2",
     )
+    cap_p_init = _restrict(loaded_cap_p, n_domain, e_domain, final_y_values, final_h_values)
     model.cap_p = pyo.Param(
         model.N,
         model.E,
         model.Y,
         model.H,
-        initialize=lambda mm, n, e, y, h: float(loaded_cap_p.get((str(n), str(e), int(y), int(h)), 0.0)),
+        initialize=cap_p_init,
         default=0.0,
         mutable=False,
         doc="Production capacity cap_p(n,e,y,h) from production.csv",
     )
+    cap_p_pos = frozenset(idx for idx, v in cap_p_init.items() if v > 0.0)
     model.c_p = pyo.Param(
         model.N,
         model.E,
         model.Y,
-        initialize=lambda mm, n, e, y: float(loaded_c_p.get((str(n), str(e), int(y)), 0.0)),
+        initialize=_restrict(loaded_c_p, n_domain, e_domain, final_y_values),
         default=0.0,
         mutable=False,
         doc="Production marginal cost c_p(n,e,y) from production.csv (MC)",
     )
+    lb_p_init = _restrict(loaded_lb_p, n_domain, e_domain, final_y_values, final_h_values)
     model.lb_p = pyo.Param(
         model.N,
         model.E,
         model.Y,
         model.H,
-        initialize=lambda mm, n, e, y, h: float(loaded_lb_p.get((str(n), str(e), int(y), int(h)), 0.0)),
+        initialize=lb_p_init,
         default=0.0,
         mutable=False,
         doc="Production lower bound lb_p(n,e,y,h) from production.csv (LB)",
@@ -346,9 +324,9 @@ def build_base_model_with_cz(
     model.c_lr = pyo.Param(
         model.N,
         model.E,
-        initialize=lambda mm, n, e: float(
-            loaded_c_lr.get((str(n), str(e)), 1.0 if str(e).upper() == "G" else 9999.0)
-        ),
+        initialize={
+            (n, e): float(loaded_c_lr.get((n, e), 1.0 if e in g_fuels else 9999.0)) for n in n_domain for e in e_domain
+        },
         default=9999.0,
         mutable=False,
         doc="Regasification unit cost c_lr(n,e)",
@@ -356,16 +334,17 @@ def build_base_model_with_cz(
     model.ub_r = pyo.Param(
         model.N,
         model.E,
-        initialize=lambda mm, n, e: float(loaded_ub_r.get((str(n), str(e)), 0.0)),
+        initialize=_restrict(loaded_ub_r, n_domain, e_domain),
         default=0.0,
         mutable=False,
         doc="Regasification hourly capacity upper bound ub_r(n,e)",
     )
+    cap_a_init = _restrict(loaded_cap_a, a_domain, e_domain, final_y_values)
     model.cap_a = pyo.Param(
         model.A,
         model.E,
         model.Y,
-        initialize=lambda mm, a, e, y: float(loaded_cap_a.get((str(a), str(e), int(y)), 0.0)),
+        initialize=cap_a_init,
         default=0.0,
         mutable=False,
         doc="Arc capacity cap_a(a,e,y)",
@@ -374,7 +353,7 @@ def build_base_model_with_cz(
         model.A,
         model.E,
         model.Y,
-        initialize=lambda mm, a, e, y: float(loaded_c_a.get((str(a), str(e), int(y)), 0.0)),
+        initialize=_restrict(loaded_c_a, a_domain, e_domain, final_y_values),
         default=0.0,
         mutable=False,
         doc="Arc flow cost c_a(a,e,y)",
@@ -383,7 +362,7 @@ def build_base_model_with_cz(
         model.A,
         model.E,
         model.Y,
-        initialize=lambda mm, a, e, y: float(loaded_c_ax.get((str(a), str(e), int(y)), 0.0)),
+        initialize=_restrict(loaded_c_ax, a_domain, e_domain, final_y_values),
         default=0.0,
         mutable=False,
         doc="Arc expansion investment cost c_ax(a,e,y)",
@@ -392,7 +371,7 @@ def build_base_model_with_cz(
         model.A,
         model.E,
         model.Y,
-        initialize=lambda mm, a, e, y: float(loaded_c_ab.get((str(a), str(e), int(y)), 0.0)),
+        initialize=_restrict(loaded_c_ab, a_domain, e_domain, final_y_values),
         default=0.0,
         mutable=False,
         doc="Bidirectional variable cost c_ab(a,e,y)",
@@ -400,7 +379,7 @@ def build_base_model_with_cz(
     model.f_ab = pyo.Param(
         model.A,
         model.Y,
-        initialize=lambda mm, a, y: float(loaded_f_ab.get((str(a), int(y)), 0.0)),
+        initialize=_restrict(loaded_f_ab, a_domain, final_y_values),
         default=0.0,
         mutable=False,
         doc="Bidirectional fixed cost f_ab(a,y)",
@@ -410,7 +389,7 @@ def build_base_model_with_cz(
         model.E,
         model.E,
         model.Y,
-        initialize=lambda mm, a, e, f, y: float(loaded_c_ar.get((str(a), str(e), str(f), int(y)), 0.0)),
+        initialize=_restrict(loaded_c_ar, a_domain, e_domain, e_domain, final_y_values),
         default=0.0,
         mutable=False,
         doc="Repurposing variable cost c_ar(a,e,f,y)",
@@ -420,7 +399,7 @@ def build_base_model_with_cz(
         model.E,
         model.E,
         model.Y,
-        initialize=lambda mm, a, e, f, y: float(loaded_f_ar.get((str(a), str(e), str(f), int(y)), 0.0)),
+        initialize=_restrict(loaded_f_ar, a_domain, e_domain, e_domain, final_y_values),
         default=0.0,
         mutable=False,
         doc="Repurposing fixed cost f_ar(a,e,f,y)",
@@ -428,7 +407,7 @@ def build_base_model_with_cz(
     model.e_a = pyo.Param(
         model.A,
         model.E,
-        initialize=lambda mm, a, e: float(loaded_e_a.get((str(a), str(e)), 1.0)),
+        initialize=_restrict(loaded_e_a, a_domain, e_domain),
         default=1.0,
         mutable=False,
         doc="Arc flow efficiency e_a(a,e)",
@@ -437,7 +416,7 @@ def build_base_model_with_cz(
         model.N,
         model.E,
         model.Y,
-        initialize=lambda mm, n, e, y: float(loaded_cap_we.get((str(n), str(e), int(y)), 0.0)),
+        initialize=_restrict(loaded_cap_we, n_domain, e_domain, final_y_values),
         default=0.0,
         mutable=False,
         doc="Storage extraction capacity cap_we(n,e,y)",
@@ -446,16 +425,17 @@ def build_base_model_with_cz(
         model.N,
         model.E,
         model.Y,
-        initialize=lambda mm, n, e, y: float(loaded_cap_wi.get((str(n), str(e), int(y)), 0.0)),
+        initialize=_restrict(loaded_cap_wi, n_domain, e_domain, final_y_values),
         default=0.0,
         mutable=False,
         doc="Storage injection capacity cap_wi(n,e,y)",
     )
+    cap_ww_init = _restrict(loaded_cap_ww, n_domain, e_domain, final_y_values)
     model.cap_ww = pyo.Param(
         model.N,
         model.E,
         model.Y,
-        initialize=lambda mm, n, e, y: float(loaded_cap_ww.get((str(n), str(e), int(y)), 0.0)),
+        initialize=cap_ww_init,
         default=0.0,
         mutable=False,
         doc="Storage working-gas capacity cap_ww(n,e,y)",
@@ -463,7 +443,9 @@ def build_base_model_with_cz(
     model.c_we = pyo.Param(
         model.N,
         model.E,
-        initialize=lambda mm, n, e: float(loaded_c_we.get((str(n), str(e)), float(mm.vols2[e]))),
+        initialize={
+            (n, e): float(loaded_c_we.get((n, e), vols2_map.get(e, 1.0))) for n in n_domain for e in e_domain
+        },
         default=0.0,
         mutable=False,
         doc="Storage extraction cost c_we(n,e)",
@@ -471,15 +453,16 @@ def build_base_model_with_cz(
     model.e_w = pyo.Param(
         model.N,
         model.E,
-        initialize=lambda mm, n, e: float(loaded_e_w.get((str(n), str(e)), 0.99)),
+        initialize=_restrict(loaded_e_w, n_domain, e_domain),
         default=0.99,
         mutable=False,
         doc="Storage cycle efficiency e_w(n,e)",
     )
+    h2_ready_init = _restrict(loaded_h2_ready, n_domain, e_domain)
     model.h2_ready = pyo.Param(
         model.N,
         model.E,
-        initialize=lambda mm, n, e: float(loaded_h2_ready.get((str(n), str(e)), 0.0)),
+        initialize=h2_ready_init,
         default=0.0,
         mutable=False,
         doc="Storage H2-ready flag/value from dat_w(n,e,'H2-ready')",
@@ -520,10 +503,33 @@ def build_base_model_with_cz(
     model.Q_E = pyo.Var(model.N, model.E, model.Y, model.H, domain=pyo.NonNegativeReals, doc="Storage extraction Q_E")
     model.Q_I = pyo.Var(model.N, model.E, model.Y, model.H, domain=pyo.NonNegativeReals, doc="Storage injection Q_I")
     model.Q_S = pyo.Var(model.N, model.E, model.Y, model.H, domain=pyo.NonNegativeReals, doc="Sales Q_S")
-    model.ZDS = pyo.Var(model.Z, model.N, model.E, model.Y, model.H, domain=pyo.NonNegativeReals, doc="Penalty slack ZDS")
-    model.ZN2 = pyo.Var(model.NUTS2, model.E, model.Y, model.H, domain=pyo.NonNegativeReals, doc="NUTS2 shortage ZN2")
+    # Slacks only exist where they can enter a demand equation: ZDS on positive non-hydrogen node demand
+    # (dmd_n3), ZN2 on positive hydrogen NUTS2 demand (dmd_n2). Elsewhere they would only add cost and stay 0.
+    model.DMD_POS = pyo.Set(
+        within=model.N * model.E * model.Y * model.H,
+        initialize=sorted(idx for idx in dmd_pos if idx[1] not in h_fuels),
+        ordered=True,
+        doc="Non-hydrogen node demand support (n,e,y,h)",
+    )
+    model.DMD2_POS = pyo.Set(
+        within=model.NUTS2 * model.E * model.Y * model.H,
+        initialize=sorted(idx for idx, v in dmd2_init.items() if v > 0.0 and idx[1] in h_fuels),
+        ordered=True,
+        doc="Hydrogen NUTS2 demand support (g,e,y,h)",
+    )
+    model.ZDS = pyo.Var(model.Z, model.DMD_POS, domain=pyo.NonNegativeReals, doc="Penalty slack ZDS")
+    model.ZN2 = pyo.Var(model.DMD2_POS, domain=pyo.NonNegativeReals, doc="NUTS2 shortage ZN2")
 
     # STEP 5: Constraints (node production + consumption only)
+    # Q_P(n,e,y,h) + sum_f Q_B(n,e,f,y,h), shared by p_cap and p_min.
+    model.p_out = pyo.Expression(
+        model.N,
+        model.E,
+        model.Y,
+        model.H,
+        rule=lambda mm, n, e, y, h: mm.Q_P[n, e, y, h] + pyo.quicksum(mm.Q_B[n, e, f, y, h] for f in mm.E),
+        doc="Production including volume blended into other carriers",
+    )
     # p_cap(n,e,y,h):
     #   if cap_p(n,e,y,h) <= 0 => Q_P(n,e,y,h) = 0
     #   else                    Q_P(n,e,y,h) + sum_f Q_B(n,e,f,y,h) <= cap_p(n,e,y,h)
@@ -533,24 +539,23 @@ def build_base_model_with_cz(
         model.Y,
         model.H,
         rule=lambda mm, n, e, y, h: (
-            mm.Q_P[n, e, y, h] + sum(mm.Q_B[n, e, f, y, h] for f in mm.E) == 0.0
-            if pyo.value(mm.cap_p[n, e, y, h]) <= 0.0
-            else mm.Q_P[n, e, y, h] + sum(mm.Q_B[n, e, f, y, h] for f in mm.E) <= mm.cap_p[n, e, y, h]
+            mm.p_out[n, e, y, h] == 0.0
+            if (n, e, y, h) not in cap_p_pos
+            else mm.p_out[n, e, y, h] <= mm.cap_p[n, e, y, h]
         ),
         doc="Production capacity (GAMS p_cap)",
     )
     # p_min(n,e,y,h):
     #   if lb_p(n,e,y,h) > 0 => Q_P(n,e,y,h) + sum_f Q_B(n,e,f,y,h) >= lb_p(n,e,y,h)
+    model.LB_P_POS = pyo.Set(
+        within=model.N * model.E * model.Y * model.H,
+        initialize=sorted(idx for idx, v in lb_p_init.items() if v > 0.0),
+        ordered=True,
+        doc="Production lower-bound support (n,e,y,h)",
+    )
     model.p_min = pyo.Constraint(
-        model.N,
-        model.E,
-        model.Y,
-        model.H,
-        rule=lambda mm, n, e, y, h: (
-            pyo.Constraint.Skip
-            if pyo.value(mm.lb_p[n, e, y, h]) <= 0.0
-            else mm.Q_P[n, e, y, h] + sum(mm.Q_B[n, e, f, y, h] for f in mm.E) >= mm.lb_p[n, e, y, h]
-        ),
+        model.LB_P_POS,
+        rule=lambda mm, n, e, y, h: mm.p_out[n, e, y, h] >= mm.lb_p[n, e, y, h],
         doc="Production lower bound (GAMS p_min)",
     )
     # Regasification hourly bound (GAMS parity subset of Q_R.up):
@@ -566,53 +571,27 @@ def build_base_model_with_cz(
 
     first_y = y_order[0] if len(y_order) > 0 else None
     y_prev_map = {y_order[idx]: y_order[idx - 1] for idx in range(1, len(y_order))}
-
-    # K_A.fx(a,e,y)$(ord(y)=1) = cap_a(a,e,y)
-    model.k_a_init = pyo.Constraint(
-        model.A,
-        model.E,
-        model.Y,
-        rule=lambda mm, a, e, y: (
-            pyo.Constraint.Skip if first_y is None or int(y) != int(first_y) else mm.K_A[a, e, y] == mm.cap_a[a, e, y]
-        ),
-        doc="Initial arc capacity stock (GAMS K_A.fx ord(y)=1)",
-    )
-
-    # K_W.fx(n,e,y)$(ORD(y)=1) = cap_ww(n,e,y)
-    model.k_w_init = pyo.Constraint(
-        model.N,
-        model.E,
-        model.Y,
-        rule=lambda mm, n, e, y: (
-            pyo.Constraint.Skip if first_y is None or int(y) != int(first_y) else mm.K_W[n, e, y] == mm.cap_ww[n, e, y]
-        ),
-        doc="Initial storage working-gas stock (GAMS K_W.fx ord(y)=1)",
-    )
+    # Equations with $(ord(y)>1) are indexed over the later years only.
+    model.YL = pyo.Set(within=model.Y, initialize=y_order[1:], ordered=True, doc="Planning years after the first")
+    # opp_in[a]: arcs ao with opp(ao,a) = 1.
+    opp_in: dict[str, list[str]] = {}
+    for ao, a in opp_pairs:
+        opp_in.setdefault(a, []).append(ao)
 
     # ar_cap(a,e,y)$(ord(y)>1): K_A(a,e,y) = sum_f K_RA(a,f,e,y) + sum(y2$ypred(y2,y), X_A(a,e,y2))
     model.ar_cap = pyo.Constraint(
         model.A,
         model.E,
-        model.Y,
-        rule=lambda mm, a, e, y: (
-            pyo.Constraint.Skip
-            if first_y is None or int(y) == int(first_y)
-            else mm.K_A[a, e, y]
-            == sum(mm.K_RA[a, f, e, y] for f in mm.E)
-            + sum(mm.X_A[a, e, y2] for y2 in mm.Y if pyo.value(mm.ypred[y2, y]) == 1)
-        ),
+        model.YL,
+        rule=lambda mm, a, e, y: mm.K_A[a, e, y] == pyo.quicksum(mm.K_RA[a, f, e, y] for f in mm.E) + mm.X_A[a, e, y_prev_map[y]],
         doc="Arc capacity with repurposing and prior-year expansion (GAMS ar_cap)",
     )
     # wr_cap(n,e,y)$(ord(y)>1): K_W(n,e,y) = sum_f K_RW(n,f,e,y)
     model.wr_cap = pyo.Constraint(
         model.N,
         model.E,
-        model.Y,
-        rule=lambda mm, n, e, y: (
-            pyo.Constraint.Skip
-            if first_y is None or int(y) == int(first_y)
-            else mm.K_W[n, e, y] == sum(mm.K_RW[n, f, e, y] for f in mm.E)
-        ),
+        model.YL,
+        rule=lambda mm, n, e, y: mm.K_W[n, e, y] == pyo.quicksum(mm.K_RW[n, f, e, y] for f in mm.E),
         doc="Storage capacity with repurposing (GAMS wr_cap)",
     )
 
@@ -636,46 +615,36 @@ def build_base_model_with_cz(
         model.A,
         model.E,
         model.Y,
-        rule=lambda mm, a, e, y: mm.K_OPP[a, e, y] <= sum(mm.opp[ao, a] * mm.K_A[ao, e, y] for ao in mm.A),
+        rule=lambda mm, a, e, y: mm.K_OPP[a, e, y] <= pyo.quicksum(mm.K_A[ao, e, y] for ao in opp_in.get(a, ())),
         doc="Reverse flow limited by opposite arc capacity (GAMS a_opp2)",
     )
-    model.k_bd_fix_is_bid = pyo.Constraint(
-        model.A,
-        model.E,
-        model.Y,
-        rule=lambda mm, a, e, y: (
-            mm.K_BD[a, e, y] == 0.0 if pyo.value(mm.is_bid[a]) == 1 else pyo.Constraint.Skip
-        ),
-        doc="Fix K_BD=0 for already bidirectional arcs (GAMS K_BD.fx $is_bid)",
+    # bd_cost(a,e,y,y2)$(not is_bid(a) and yscai(y2,y)): only non-bidirectional arcs and y2 at or after y.
+    model.BD_COST_IDX = pyo.Set(
+        within=model.A * model.E * model.Y * model.Y,
+        initialize=[
+            (a, e, y, y2)
+            for a in a_domain
+            if a not in bid_arcs
+            for e in e_domain
+            for idx, y in enumerate(y_order)
+            for y2 in y_order[idx:]
+        ],
+        ordered=True,
+        doc="Index of bd_cost rows",
     )
     model.bd_cost = pyo.Constraint(
-        model.A,
-        model.E,
-        model.Y,
-        model.Y,
-        rule=lambda mm, a, e, y, y2: (
-            pyo.Constraint.Skip
-            if pyo.value(mm.is_bid[a]) == 1 or pyo.value(mm.yscai[y2, y]) != 1
-            else mm.K_BD[a, e, y] >= mm.K_OPP[a, e, y2] - (1.0 - mm.B_BD[a, y]) * mm.bigM
-        ),
+        model.BD_COST_IDX,
+        rule=lambda mm, a, e, y, y2: mm.K_BD[a, e, y] >= mm.K_OPP[a, e, y2] - (1.0 - mm.B_BD[a, y]) * mm.bigM,
         doc="Bidirectional variable-cost volume lower bound (GAMS bd_cost)",
     )
-    model.bd_fix_is_bid = pyo.Constraint(
-        model.A,
-        model.Y,
-        rule=lambda mm, a, y: (
-            mm.BD[a, y] == 1.0 if pyo.value(mm.is_bid[a]) == 1 else pyo.Constraint.Skip
-        ),
-        doc="Fix BD=1 for already bidirectional arcs (GAMS BD.fx $is_bid)",
-    )
     model.bidir = pyo.Constraint(
         model.A,
         model.Y,
         rule=lambda mm, a, y: (
             pyo.Constraint.Skip
-            if pyo.value(mm.is_bid[a]) == 1
+            if a in bid_arcs
             else mm.BD[a, y]
-            <= mm.B_BD[a, y] + sum(mm.BD[a, y2] for y2 in mm.Y if pyo.value(mm.ypred[y2, y]) == 1)
+            <= mm.B_BD[a, y] + (mm.BD[a, y_prev_map[y]] if y in y_prev_map else 0.0)
         ),
         doc="Bidirectional state propagation (GAMS bidir)",
     )
@@ -683,118 +652,106 @@ def build_base_model_with_cz(
     model.sos_a = pyo.Constraint(
         model.A,
         model.E,
-        model.Y,
-        rule=lambda mm, a, e, y: (
-            pyo.Constraint.Skip
-            if first_y is None or int(y) == int(first_y)
-            else sum(mm.B_AR[a, e, f, y] for f in mm.E) == 1.0
-        ),
+        model.YL,
+        rule=lambda mm, a, e, y: pyo.quicksum(mm.B_AR[a, e, f, y] for f in mm.E) == 1.0,
         doc="Single arc repurposing destination (GAMS sos_a)",
     )
     # sos_w(n,e,y)$(ord(y)>1): sum_f B_WR(n,e,f,y) = 1
     model.sos_w = pyo.Constraint(
         model.N,
         model.E,
-        model.Y,
-        rule=lambda mm, n, e, y: (
-            pyo.Constraint.Skip
-            if first_y is None or int(y) == int(first_y)
-            else sum(mm.B_WR[n, e, f, y] for f in mm.E) == 1.0
-        ),
+        model.YL,
+        rule=lambda mm, n, e, y: pyo.quicksum(mm.B_WR[n, e, f, y] for f in mm.E) == 1.0,
         doc="Single storage repurposing destination (GAMS sos_w)",
     )
-    # B_AR.fx(a,e,f,y)$(ORD(y)=1)=0
-    model.b_ar_fix_first = pyo.Constraint(
-        model.A,
-        model.E,
-        model.E,
-        model.Y,
-        rule=lambda mm, a, e, f, y: (
-            pyo.Constraint.Skip if first_y is None or int(y) != int(first_y) else mm.B_AR[a, e, f, y] == 0.0
-        ),
-        doc="Fix B_AR(a,e,f,firstY)=0 to enforce no first-period repurposing",
-    )
-    # K_RA.fx(a,e,f,y)$(ORD(y)=1)=0
-    model.k_ra_fix_first = pyo.Constraint(
-        model.A,
-        model.E,
-        model.E,
-        model.Y,
-        rule=lambda mm, a, e, f, y: (
-            pyo.Constraint.Skip if first_y is None or int(y) != int(first_y) else mm.K_RA[a, e, f, y] == 0.0
-        ),
-        doc="Fix K_RA(a,e,f,firstY)=0 (GAMS first-period rule)",
-    )
-    # B_WR.fx(n,e,f,y)$(ORD(y)=1)=0
-    model.b_wr_fix_first = pyo.Constraint(
-        model.N,
-        model.E,
-        model.E,
-        model.Y,
-        rule=lambda mm, n, e, f, y: (
-            pyo.Constraint.Skip if first_y is None or int(y) != int(first_y) else mm.B_WR[n, e, f, y] == 0.0
-        ),
-        doc="Fix B_WR(n,e,f,firstY)=0 to enforce no first-period repurposing",
-    )
-    # K_RW.fx(n,e,f,y)$(ORD(y)=1)=0
-    model.k_rw_fix_first = pyo.Constraint(
-        model.N,
-        model.E,
-        model.E,
-        model.Y,
-        rule=lambda mm, n, e, f, y: (
-            pyo.Constraint.Skip if first_y is None or int(y) != int(first_y) else mm.K_RW[n, e, f, y] == 0.0
-        ),
-        doc="Fix K_RW(n,e,f,firstY)=0 (GAMS first-period rule)",
-    )
+    # Variable fixings (GAMS .fx) are applied as bounds rather than equality rows:
+    # K_BD.fx(a,e,y)$is_bid(a)=0 and BD.fx(a,y)$is_bid(a)=1
+    for a in bid_arcs:
+        for y in y_order:
+            model.BD[a, y].fix(1.0)
+            for e in e_domain:
+                model.K_BD[a, e, y].fix(0.0)
+    # First-year stocks: K_A.fx(a,e,y)$(ord(y)=1)=cap_a(a,e,y), K_W.fx(n,e,y)$(ord(y)=1)=cap_ww(n,e,y)
+    # and no first-period repurposing: B_AR/K_RA(a,e,f,y)$(ORD(y)=1)=0, B_WR/K_RW(n,e,f,y)$(ORD(y)=1)=0
+    if first_y is not None:
+        for e in e_domain:
+            for a in a_domain:
+                model.K_A[a, e, first_y].fix(cap_a_init.get((a, e, first_y), 0.0))
+                for f in e_domain:
+                    model.B_AR[a, e, f, first_y].fix(0.0)
+                    model.K_RA[a, e, f, first_y].fix(0.0)
+            for n in n_domain:
+                model.K_W[n, e, first_y].fix(cap_ww_init.get((n, e, first_y), 0.0))
+                for f in e_domain:
+                    model.B_WR[n, e, f, first_y].fix(0.0)
+                    model.K_RW[n, e, f, first_y].fix(0.0)
     # K_W.fx(n,'G',y)$(dat_w(n,'G','H2-ready')<=0)=cap_ww(n,'G',y)
-    model.k_w_fix_h2_ready = pyo.Constraint(
-        model.N,
-        model.Y,
-        rule=lambda mm, n, y: (
-            mm.K_W[n, "G", y] == mm.cap_ww[n, "G", y]
-            if "G" in mm.E and pyo.value(mm.h2_ready[n, "G"]) <= 0.0
-            else pyo.Constraint.Skip
-        ),
-        doc="Fix gas storage stock when not H2-ready (GAMS K_W.fx by H2-ready)",
-    )
+    if "G" in e_domain:
+        for n in n_domain:
+            if h2_ready_init.get((n, "G"), 0.0) <= 0.0:
+                for y in y_order:
+                    model.K_W[n, "G", y].fix(cap_ww_init.get((n, "G", y), 0.0))
     # bil_a1(a,e,y)$(ord(y)>1): sum_f K_RA(a,e,f,y) = sum(y2$ypred(y2,y), K_A(a,e,y2))
     model.bil_a1 = pyo.Constraint(
         model.A,
         model.E,
-        model.Y,
-        rule=lambda mm, a, e, y: (
-            pyo.Constraint.Skip
-            if first_y is None or int(y) == int(first_y)
-            else sum(mm.K_RA[a, e, f, y] for f in mm.E)
-            == sum(mm.K_A[a, e, y2] for y2 in mm.Y if pyo.value(mm.ypred[y2, y]) == 1)
-        ),
+        model.YL,
+        rule=lambda mm, a, e, y: pyo.quicksum(mm.K_RA[a, e, f, y] for f in mm.E)
+        == mm.K_A[a, e, y_prev_map[y]],
         doc="Repurposed arc capacity conservation (GAMS bil_a1)",
     )
     # bil_w1(n,e,y)$(ord(y)>1): sum_f K_RW(n,e,f,y) = sum(y2$ypred(y2,y), K_W(n,e,y2))
     model.bil_w1 = pyo.Constraint(
         model.N,
         model.E,
+        model.YL,
+        rule=lambda mm, n, e, y: pyo.quicksum(mm.K_RW[n, e, f, y] for f in mm.E)
+        == mm.K_W[n, e, y_prev_map[y]],
+        doc="Repurposed storage capacity conservation (GAMS bil_w1)",
+    )
+    # Big-M for bil_a2/bil_w2, tightened where a valid bound is known. bil_a1/bil_w1 give
+    # K_RA(a,e,f,y) <= K_A(a,e,y-1) and K_RW(n,e,f,y) <= K_W(n,e,y-1):
+    #   - K_A is fixed to cap_a in the first year, which bounds the second year; later years
+    #     may include unbounded expansion X_A and keep the global bigM.
+    #   - wr_cap/bil_w1 only move storage stock between carriers, so sum_e cap_ww(n,e,first year)
+    #     bounds K_W(n,e,y) in every year.
+    bigm_scalar = float(bigm_value)
+    second_y = y_order[1] if len(y_order) > 1 else None
+    model.bigM_ar = pyo.Param(
+        model.A,
+        model.E,
         model.Y,
-        rule=lambda mm, n, e, y: (
-            pyo.Constraint.Skip
-            if first_y is None or int(y) == int(first_y)
-            else sum(mm.K_RW[n, e, f, y] for f in mm.E)
-            == sum(mm.K_W[n, e, y2] for y2 in mm.Y if pyo.value(mm.ypred[y2, y]) == 1)
+        initialize=(
+            {}
+            if second_y is None
+            else {
+                (a, e, second_y): min(bigm_scalar, cap_a_init.get((a, e, first_y), 0.0))
+                for a in a_domain
+                for e in e_domain
+            }
         ),
-        doc="Repurposed storage capacity conservation (GAMS bil_w1)",
+        default=bigm_scalar,
+        mutable=False,
+        doc="Big-M for arc repurposing bigM_ar(a,e,y)",
+    )
+    model.bigM_wr = pyo.Param(
+        model.N,
+        initialize=(
+            {}
+            if first_y is None
+            else {n: min(bigm_scalar, sum(cap_ww_init.get((n, e, first_y), 0.0) for e in e_domain)) for n in n_domain}
+        ),
+        default=bigm_scalar,
+        mutable=False,
+        doc="Big-M for storage repurposing bigM_wr(n)",
     )
     # bil_a2(a,e,f,y)$(ord(y)>1): K_RA(a,e,f,y) <= B_AR(a,e,f,y)*bigM
     model.bil_a2 = pyo.Constraint(
         model.A,
         model.E,
         model.E,
-        model.Y,
-        rule=lambda mm, a, e, f, y: (
-            pyo.Constraint.Skip
-            if first_y is None or int(y) == int(first_y)
-            else mm.K_RA[a, e, f, y] <= mm.B_AR[a, e, f, y] * mm.bigM
-        ),
+        model.YL,
+        rule=lambda mm, a, e, f, y: mm.K_RA[a, e, f, y] <= mm.B_AR[a, e, f, y] * mm.bigM_ar[a, e, y],
         doc="Arc repurposing big-M link (GAMS bil_a2)",
     )
     # bil_w2(n,e,f,y)$(ord(y)>1): K_RW(n,e,f,y) <= B_WR(n,e,f,y)*bigM
@@ -802,12 +759,8 @@ def build_base_model_with_cz(
         model.N,
         model.E,
         model.E,
-        model.Y,
-        rule=lambda mm, n, e, f, y: (
-            pyo.Constraint.Skip
-            if first_y is None or int(y) == int(first_y)
-            else mm.K_RW[n, e, f, y] <= mm.B_WR[n, e, f, y] * mm.bigM
-        ),
+        model.YL,
+        rule=lambda mm, n, e, f, y: mm.K_RW[n, e, f, y] <= mm.B_WR[n, e, f, y] * mm.bigM_wr[n],
         doc="Storage repurposing big-M link (GAMS bil_w2)",
     )
     # Storage flow bounds (GAMS subset of Q_E.up / Q_I.up assignments):
@@ -832,110 +785,75 @@ def build_base_model_with_cz(
     # dmd_n3(n,e,y,h) for not_h(e) and dmd(n,e,y,h) > 0:
     #   Q_S(n,e,y,h) = dmd(n,e,y,h) - ZDS(ZD2,n,e,y,h)
     model.dmd_n3 = pyo.Constraint(
-        model.N,
-        model.E,
-        model.Y,
-        model.H,
+        model.DMD_POS,
         rule=lambda mm, n, e, y, h: (
-            pyo.Constraint.Skip
-            if z_dmd is None or pyo.value(mm.not_h[e]) != 1 or pyo.value(mm.dmd[n, e, y, h]) <= 0.0
-            else mm.Q_S[n, e, y, h] == mm.dmd[n, e, y, h] - mm.ZDS[z_dmd, n, e, y, h]
+            pyo.Constraint.Skip if z_dmd is None else mm.Q_S[n, e, y, h] == mm.dmd[n, e, y, h] - mm.ZDS[z_dmd, n, e, y, h]
         ),
         doc="NUTS3 demand for non-hydrogen (GAMS dmd_n3)",
     )
     # If non-hydrogen demand is zero/non-positive, fix served demand to zero.
+    model.QS_ZERO_IDX = pyo.Set(
+        within=model.N * model.E * model.Y * model.H,
+        initialize=[
+            (n, e, y, h)
+            for n in n_domain
+            for e in e_domain
+            if e not in h_fuels
+            for y in y_order
+            for h in final_h_values
+            if (n, e, y, h) not in dmd_pos
+        ],
+        ordered=True,
+        doc="Non-hydrogen (n,e,y,h) without positive demand",
+    )
     model.qs_zero_nonh = pyo.Constraint(
-        model.N,
-        model.E,
-        model.Y,
-        model.H,
-        rule=lambda mm, n, e, y, h: (
-            pyo.Constraint.Skip
-            if pyo.value(mm.not_h[e]) != 1 or pyo.value(mm.dmd[n, e, y, h]) > 0.0
-            else mm.Q_S[n, e, y, h] == 0.0
-        ),
+        model.QS_ZERO_IDX,
+        rule=lambda mm, n, e, y, h: mm.Q_S[n, e, y, h] == 0.0,
         doc="Fix Q_S=0 for non-hydrogen when demand is non-positive",
     )
-    # If non-hydrogen demand is zero/non-positive, fix ZDS(ZD2) to zero.
-    model.zd2_zero_nonh = pyo.Constraint(
-        model.N,
-        model.E,
-        model.Y,
-        model.H,
-        rule=lambda mm, n, e, y, h: (
-            pyo.Constraint.Skip
-            if z_dmd is None or pyo.value(mm.not_h[e]) != 1 or pyo.value(mm.dmd[n, e, y, h]) > 0.0
-            else mm.ZDS[z_dmd, n, e, y, h] == 0.0
-        ),
-        doc="Fix ZDS(ZD2)=0 for non-hydrogen when demand is non-positive",
-    )
     # Q_B.fx(n,e,f,y,h)$(not_h(e) OR not_g(f)) = 0
-    model.qb_fix_type = pyo.Constraint(
-        model.N,
-        model.E,
-        model.E,
-        model.Y,
-        model.H,
-        rule=lambda mm, n, e, f, y, h: (
-            mm.Q_B[n, e, f, y, h] == 0.0
-            if pyo.value(mm.not_h[e]) == 1 or pyo.value(mm.not_g[f]) == 1
-            else pyo.Constraint.Skip
-        ),
-        doc="Fix Q_B=0 unless hydrogen blended into gas (GAMS Q_B.fx type)",
-    )
     # Q_B.fx(n,e,f,y,h)$(cap_p(n,e,y,h)<=0) = 0
-    model.qb_fix_cap = pyo.Constraint(
-        model.N,
-        model.E,
-        model.E,
-        model.Y,
-        model.H,
-        rule=lambda mm, n, e, f, y, h: (
-            mm.Q_B[n, e, f, y, h] == 0.0
-            if pyo.value(mm.cap_p[n, e, y, h]) <= 0.0
-            else pyo.Constraint.Skip
-        ),
-        doc="Fix Q_B=0 when source production capacity is non-positive (GAMS Q_B.fx cap)",
-    )
     # Q_B.fx(n,e,e,y,h) = 0
-    model.qb_fix_same = pyo.Constraint(
-        model.N,
-        model.E,
-        model.Y,
-        model.H,
-        rule=lambda mm, n, e, y, h: mm.Q_B[n, e, e, y, h] == 0.0,
-        doc="Fix Q_B=0 for same carrier blending (GAMS Q_B.fx e=e)",
-    )
+    # Only hydrogen blended into gas at a node with production capacity stays free.
+    for n in n_domain:
+        for e in e_domain:
+            for f in e_domain:
+                blend_pair = e in h_fuels and f in g_fuels and e != f
+                for y in y_order:
+                    for h in final_h_values:
+                        if not blend_pair or (n, e, y, h) not in cap_p_pos:
+                            model.Q_B[n, e, f, y, h].fix(0.0)
     # max_bl(n,f,e,y,h)$(is_h(f) AND is_g(e) AND cap_p(n,f,y,h)>0)..
     #   Q_B(n,f,e,y,h) <= ub_bl(f,e)*(Q_S(n,e,y,h)+sum(a$a_s(a,n),F_A(a,e,y,h))+Q_I(n,e,y,h))
+    model.BL_IDX = pyo.Set(
+        within=model.N * model.E * model.E * model.Y * model.H,
+        initialize=[
+            (n, f, e, y, h)
+            for n in n_domain
+            for f in e_domain
+            if f in h_fuels
+            for e in e_domain
+            if e in g_fuels
+            for y in y_order
+            for h in final_h_values
+            if (n, f, y, h) in cap_p_pos
+        ],
+        ordered=True,
+        doc="Hydrogen-into-gas blending with positive source capacity (n,f,e,y,h)",
+    )
     model.max_bl = pyo.Constraint(
-        model.N,
-        model.E,
-        model.E,
-        model.Y,
-        model.H,
-        rule=lambda mm, n, f, e, y, h: (
-            pyo.Constraint.Skip
-            if pyo.value(mm.is_h[f]) != 1 or pyo.value(mm.is_g[e]) != 1 or pyo.value(mm.cap_p[n, f, y, h]) <= 0.0
-            else mm.Q_B[n, f, e, y, h]
-            <= mm.ub_bl[f, e]
-            * (mm.Q_S[n, e, y, h] + sum(mm.F_A[a, e, y, h] for a in mm.A if pyo.value(mm.a_s[a, n]) == 1) + mm.Q_I[n, e, y, h])
-        ),
+        model.BL_IDX,
+        rule=lambda mm, n, f, e, y, h: mm.Q_B[n, f, e, y, h]
+        <= mm.ub_bl[f, e]
+        * (mm.Q_S[n, e, y, h] + pyo.quicksum(mm.F_A[a, e, y, h] for a in arcs_out.get(n, ())) + mm.Q_I[n, e, y, h]),
         doc="Blending upper share limit (GAMS max_bl)",
     )
     # dmd_n2(nuts2,e,y,h) for is_h(e) and dmd2(nuts2,e,y,h) > 0:
     #   sum_{n in N(g)} Q_S(n,e,y,h) = dmd2(g,e,y,h) - ZN2(g,e,y,h)
     model.dmd_n2 = pyo.Constraint(
-        model.NUTS2,
-        model.E,
-        model.Y,
-        model.H,
-        rule=lambda mm, g, e, y, h: (
-            pyo.Constraint.Skip
-            if pyo.value(mm.is_h[e]) != 1 or pyo.value(mm.dmd2[g, e, y, h]) <= 0.0
-            else sum(mm.Q_S[n, e, y, h] for n in mm.N if pyo.value(mm.n_in_2[n, g]) == 1)
-            == mm.dmd2[g, e, y, h] - mm.ZN2[g, e, y, h]
-        ),
+        model.DMD2_POS,
+        rule=lambda mm, g, e, y, h: pyo.quicksum(mm.Q_S[n, e, y, h] for n in nodes_in_2.get(g, ()))
+        == mm.dmd2[g, e, y, h] - mm.ZN2[g, e, y, h],
         doc="NUTS2 hydrogen demand (GAMS dmd_n2)",
     )
     # mb(n,e,y,h) flow-only subset with arcs (no blending):
@@ -946,12 +864,12 @@ def build_base_model_with_cz(
         model.Y,
         model.H,
         rule=lambda mm, n, e, y, h: mm.Q_P[n, e, y, h]
-        + sum(mm.F_A[a, e, y, h] * mm.e_a[a, e] for a in mm.A if pyo.value(mm.a_e[a, n]) == 1)
+        + pyo.quicksum(mm.F_A[a, e, y, h] * mm.e_a[a, e] for a in arcs_in.get(n, ()))
         + mm.Q_E[n, e, y, h]
         + mm.Q_R[n, e, y, h]
-        + sum(mm.Q_B[n, f, e, y, h] for f in mm.E)
+        + pyo.quicksum(mm.Q_B[n, f, e, y, h] for f in mm.E)
         == mm.Q_S[n, e, y, h]
-        + sum(mm.F_A[a, e, y, h] for a in mm.A if pyo.value(mm.a_s[a, n]) == 1)
+        + pyo.quicksum(mm.F_A[a, e, y, h] for a in arcs_out.get(n, ()))
         + mm.Q_I[n, e, y, h],
         doc="Node balance subset with arc flows and blending",
     )
@@ -960,7 +878,7 @@ def build_base_model_with_cz(
         model.N,
         model.E,
         model.Y,
-        rule=lambda mm, n, e, y: sum(mm.scaleUp[h] * mm.Q_E[n, e, y, h] for h in mm.H) * mm.vols2[e]
+        rule=lambda mm, n, e, y: pyo.quicksum(mm.scaleUp[h] * mm.Q_E[n, e, y, h] for h in mm.H) * mm.vols2[e]
         <= mm.K_W[n, e, y],
         doc="Storage working-gas limit with repurposed stock (GAMS w_lim)",
     )
@@ -969,8 +887,8 @@ def build_base_model_with_cz(
         model.N,
         model.E,
         model.Y,
-        rule=lambda mm, n, e, y: sum(mm.scaleUp[h] * mm.Q_E[n, e, y, h] for h in mm.H)
-        == mm.e_w[n, e] * sum(mm.scaleUp[h] * mm.Q_I[n, e, y, h] for h in mm.H),
+        rule=lambda mm, n, e, y: pyo.quicksum(mm.scaleUp[h] * mm.Q_E[n, e, y, h] for h in mm.H)
+        == mm.e_w[n, e] * pyo.quicksum(mm.scaleUp[h] * mm.Q_I[n, e, y, h] for h in mm.H),
         doc="Storage cycle balance",
     )
 
@@ -981,81 +899,44 @@ def build_base_model_with_cz(
     #                                        + c_we(n,e)*Q_E(n,e,y,h)
     #                                        + c_z('ZD2',e)*ZDS('ZD2',n,e,y,h) ]
     #      + sum_{nuts2,e,y,h} r(y)*scaleUp(h) * c_z('ZD2',e)*ZN2(nuts2,e,y,h)
+    # Discount and duration weights are folded into one coefficient per term. Zero-cost terms are kept:
+    # they are what hands otherwise unreferenced variables (e.g. first-year X_A) to the solver.
+    r_scale = {(y, h): model.r[y] * model.scaleUp[h] for y in y_order for h in final_h_values}
+    r_eoh = {y: model.r[y] * model.EOH[y] for y in y_order}
+
+    def cost_terms():
+        for n in n_domain:
+            for e in e_domain:
+                for y in y_order:
+                    for h in final_h_values:
+                        yield r_scale[y, h] * model.c_p[n, e, y], model.Q_P[n, e, y, h]
+                        yield r_scale[y, h] * model.c_lr[n, e], model.Q_R[n, e, y, h]
+                        yield r_scale[y, h] * model.c_we[n, e], model.Q_E[n, e, y, h]
+        for z, n, e, y, h in model.ZDS:
+            yield r_scale[y, h] * model.c_z[z, e], model.ZDS[z, n, e, y, h]
+        for a in a_domain:
+            for y in y_order:
+                yield r_eoh[y] * model.f_ab[a, y], model.B_BD[a, y]
+                for e in e_domain:
+                    yield r_eoh[y] * model.c_ax[a, e, y], model.X_A[a, e, y]
+                    yield r_eoh[y] * model.c_ab[a, e, y], model.K_BD[a, e, y]
+                    for f in e_domain:
+                        yield r_eoh[y] * model.f_ar[a, e, f, y], model.B_AR[a, e, f, y]
+                        yield r_eoh[y] * model.c_ar[a, e, f, y], model.K_RA[a, e, f, y]
+                    for h in final_h_values:
+                        yield r_scale[y, h] * model.c_a[a, e, y], model.F_A[a, e, y, h]
+        for n in n_domain:
+            for e in e_domain:
+                for f in e_domain:
+                    for y in y_order:
+                        for h in final_h_values:
+                            yield r_scale[y, h] * model.c_bl[e, f], model.Q_B[n, e, f, y, h]
+        if z_dmd is not None:
+            for g, e, y, h in model.ZN2:
+                yield r_scale[y, h] * model.c_z[z_dmd, e], model.ZN2[g, e, y, h]
+
     model.obj_total_cost = pyo.Objective(
-        expr=sum(
-            model.r[y] * model.scaleUp[h] * (
-                model.c_p[n, e, y] * model.Q_P[n, e, y, h]
-                + model.c_lr[n, e] * model.Q_R[n, e, y, h]
-                + model.c_we[n, e] * model.Q_E[n, e, y, h]
-            )
-            for n in model.N
-            for e in model.E
-            for y in model.Y
-            for h in model.H
-        )
-        + sum(
-            model.r[y] * model.scaleUp[h] * model.c_z[z, e] * model.ZDS[z, n, e, y, h]
-            for z in model.Z
-            for n in model.N
-            for e in model.E
-            for y in model.Y
-            for h in model.H
-        )
-        + sum(
-            model.r[y] * model.EOH[y] * model.c_ax[a, e, y] * model.X_A[a, e, y]
-            for a in model.A
-            for e in model.E
-            for y in model.Y
-        )
-        + sum(
-            model.r[y] * model.EOH[y] * model.f_ab[a, y] * model.B_BD[a, y]
-            for a in model.A
-            for y in model.Y
-        )
-        + sum(
-            model.r[y] * model.EOH[y] * model.c_ab[a, e, y] * model.K_BD[a, e, y]
-            for a in model.A
-            for e in model.E
-            for y in model.Y
-        )
-        + sum(
-            model.r[y] * model.EOH[y] * model.f_ar[a, e, f, y] * model.B_AR[a, e, f, y]
-            for a in model.A
-            for e in model.E
-            for f in model.E
-            for y in model.Y
-        )
-        + sum(
-            model.r[y] * model.EOH[y] * model.c_ar[a, e, f, y] * model.K_RA[a, e, f, y]
-            for a in model.A
-            for e in model.E
-            for f in model.E
-            for y in model.Y
-        )
-        + sum(
-            model.r[y] * model.scaleUp[h] * model.c_a[a, e, y] * model.F_A[a, e, y, h]
-            for a in model.A
-            for e in model.E
-            for y in model.Y
-            for h in model.H
-        )
-        + sum(
-            model.r[y] * model.scaleUp[h] * model.c_bl[e, f] * model.Q_B[n, e, f, y, h]
-            for n in model.N
-            for e in model.E
-            for f in model.E
-            for y in model.Y
-            for h in model.H
-        )
-        + sum(
-            model.r[y]
-            * model.scaleUp[h]
-            * (0.0 if z_dmd is None else model.c_z[z_dmd, e] * model.ZN2[g, e, y, h])
-            for g in model.NUTS2
-            for e in model.E
-            for y in model.Y
-            for h in model.H
-        ),
+        expr=pyo.quicksum(coef * var for coef, var in cost_terms()),
         sense=pyo.minimize,
         doc="Total cost from node production/consumption subset",
     )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Tuple, Iterable, Optional
 import pandas as pd
 
-from .utils import _clean_str, _to_float
+from .utils import _clean_str
 
 
 PenaltyKey = Tuple[str, str]
@@ -15,19 +16,74 @@ def norm(value) -> str:
     return _clean_str(value) or ""
 
 
+def _norm_series(values: pd.Series) -> pd.Series:
+    """Vectorized `norm` over a column: missing -> '', otherwise stripped text."""
+    return values.astype("string").fillna("").str.strip().astype(object)
+
+
 def _prepare_dat_o(dat_o: pd.DataFrame) -> pd.DataFrame:
     """
     Return a cleaned copy with normalized parameter/index columns and numeric value.
     Expected columns: param, indx1, indx2, value
     """
     df = dat_o.copy()
-    df["param"] = df["param"].map(norm).str.lower()
-    df["indx1"] = df["indx1"].map(norm)
-    df["indx2"] = df["indx2"].map(norm)
-    df["value"] = df["value"].map(_to_float)
+    df["param"] = _norm_series(df["param"]).str.lower()
+    df["indx1"] = _norm_series(df["indx1"])
+    df["indx2"] = _norm_series(df["indx2"])
+    df["value"] = pd.to_numeric(df["value"].astype("string").str.strip(), errors="coerce").fillna(0.0).astype("float64")
+    return df
+
+
+_PREPARED_CACHE: dict[int, tuple[pd.DataFrame, pd.DataFrame]] = {}
+_PREPARED_CACHE_SIZE = 4
+
+
+def _prepared(dat_o: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cached _prepare_dat_o keyed on the identity of dat_o.
+    The source frame is kept alongside the result, so its id cannot be reused while cached.
+    The returned frame is shared between callers and must not be modified in place.
+    """
+    cached = _PREPARED_CACHE.get(id(dat_o))
+    if cached is not None and cached[0] is dat_o:
+        return cached[1]
+    df = _prepare_dat_o(dat_o)
+    if len(_PREPARED_CACHE) >= _PREPARED_CACHE_SIZE:
+        _PREPARED_CACHE.pop(next(iter(_PREPARED_CACHE)))
+    _PREPARED_CACHE[id(dat_o)] = (dat_o, df)
     return df
 
 
+def clear_prepared_cache() -> None:
+    """Drop all cached _prepare_dat_o results (needed if a cached dat_o is mutated in place)."""
+    _PREPARED_CACHE.clear()
+
+
+@lru_cache(maxsize=8)
+def _normalized_domain(values: Tuple[object, ...]) -> Tuple[str, ...]:
+    return tuple(sorted({norm(v) for v in values if norm(v) != ""}))
+
+
+def _domain(values: Iterable[object]) -> Tuple[str, ...]:
+    """Sorted, normalized, non-empty domain labels; cached so builders sharing e_values normalize once."""
+    return _normalized_domain(tuple(values))
+
+
+@lru_cache(maxsize=8)
+def _pair_grid(domain: Tuple[str, ...]) -> pd.MultiIndex:
+    """Full (e,f) product over a domain, shared by the pair-parameter builders."""
+    return pd.MultiIndex.from_product([list(domain), list(domain)])
+
+
+def _last_by_pair(rows: pd.DataFrame) -> pd.Series:
+    """Value series indexed by (indx1, indx2); the last row wins on duplicates, as in a dict build."""
+    rows = rows.drop_duplicates(subset=["indx1", "indx2"], keep="last")
+    return pd.Series(
+        rows["value"].astype(float).to_numpy(),
+        index=pd.MultiIndex.from_arrays([rows["indx1"].tolist(), rows["indx2"].tolist()]),
+    )
+
+
 def build_penalty_lookup(dat_o: pd.DataFrame) -> PenaltyLookup:
     """
     Build lookup for penalty rows:
@@ -35,13 +91,10 @@ def build_penalty_lookup(dat_o: pd.DataFrame) -> PenaltyLookup:
       value -> numeric penalty
     Accepts both 'penalty' and misspelled 'penality'.
     """
-    df = _prepare_dat_o(dat_o)
+    df = _prepared(dat_o)
     penalties = df[df["param"].isin(["penalty", "penality"])]
 
-    lookup: PenaltyLookup = {}
-    for z, e, value in penalties[["indx1", "indx2", "value"]].itertuples(index=False, name=None):
-        lookup[(z, e)] = value
-    return lookup
+    return dict(zip(zip(penalties["indx1"].tolist(), penalties["indx2"].tolist()), penalties["value"].tolist()))
 
 
 def penalty_value(lookup: PenaltyLookup, z: str, e: str) -> float:
@@ -76,29 +129,47 @@ def build_c_z(
       - if z_values/e_values provided, use those (recommended for full GAMS parity)
       - otherwise infer from dat_o penalty rows (non-empty indices)
     """
-    df = _prepare_dat_o(dat_o)
+    df = _prepared(dat_o)
     penalty_rows = df[df["param"].isin(["penalty", "penality"])]
 
     if z_values is None:
         z_domain = sorted({z for z in penalty_rows["indx1"] if z != ""})
     else:
-        z_domain = sorted({norm(z) for z in z_values if norm(z) != ""})
+        z_domain = list(_domain(z_values))
 
     if e_values is None:
         e_domain = sorted({e for e in penalty_rows["indx2"] if e != ""}) or [""]
     else:
-        e_domain = sorted({norm(e) for e in e_values if norm(e) != ""}) or [""]
-
-    lookup = build_penalty_lookup(df)
+        e_domain = list(_domain(e_values)) or [""]
 
-    rows = []
-    for z in z_domain:
-        for e in e_domain:
-            rows.append({"z": z, "e": e, "c_z": penalty_value(lookup, z, e)})
+    # penalty_value's fallback chain applied over the whole (z,e) grid at once.
+    penalties = _last_by_pair(penalty_rows)
+    grid = pd.MultiIndex.from_product([z_domain, e_domain], names=["z", "e"])
+    vals = penalties.reindex(grid).fillna(0.0)
+    row_default = penalties[penalties.index.get_level_values(1) == ""].droplevel(1)
+    vals = vals.where(vals > 0, row_default.reindex(grid.get_level_values("z")).fillna(0.0).to_numpy())
+    vals = vals.where(vals > 0, float(penalties.get(("", ""), 0.0)))
 
+    rows = [(z, e, value) for (z, e), value in zip(grid.tolist(), vals.astype(float).tolist())]
     return pd.DataFrame(rows, columns=["z", "e", "c_z"])
 
 
+def build_all_scalars(dat_o: pd.DataFrame, defaults: Dict[str, float]) -> Dict[str, float]:
+    """
+    Build several scalar parameters from dat_o in one pass.
+
+    defaults maps each parameter name to the value used when the parameter is
+    missing or non-positive. Per name, the same rules as build_scalar_param apply:
+      - ignore indx1 / indx2
+      - if multiple rows exist, use first strictly positive value
+    """
+    df = _prepared(dat_o)
+    first_positive = df[df["value"] > 0].groupby("param", sort=False)["value"].first()
+    return {
+        name: float(first_positive.get(norm(name).lower(), default)) for name, default in defaults.items()
+    }
+
+
 def build_scalar_param(dat_o: pd.DataFrame, param_name: str) -> float:
     """
     Build scalar parameter from dat_o(param_name).
@@ -109,15 +180,7 @@ def build_scalar_param(dat_o: pd.DataFrame, param_name: str) -> float:
       - if multiple rows exist, use first strictly positive value
       - if missing or non-positive, return 0.0
     """
-    df = _prepare_dat_o(dat_o)
-    rows = df[df["param"] == norm(param_name).lower()]
-
-    for value in rows["value"].tolist():
-        v = float(value)
-        if v > 0:
-            return v
-
-    return 0.0
+    return build_all_scalars(dat_o, {param_name: 0.0})[param_name]
 
 
 def build_bigM(dat_o: pd.DataFrame) -> float:
@@ -156,10 +219,7 @@ def build_disc_rate(dat_o: pd.DataFrame, default: float = 0.02) -> float:
       - if multiple rows exist, use first strictly positive value
       - if missing or non-positive, return default (0.02)
     """
-    value = build_scalar_param(dat_o, "discrate")
-    if value > 0:
-        return value
-    return float(default)
+    return build_all_scalars(dat_o, {"discrate": float(default)})["discrate"]
 
 
 def build_vola2(
@@ -174,22 +234,18 @@ def build_vola2(
       vola2(e)=1;
       vola2(e)$dat_o('vola2',e,'')=dat_o('vola2',e,'');
     """
-    df = _prepare_dat_o(dat_o)
+    df = _prepared(dat_o)
     rows = df[df["param"] == "vola2"]
 
     if e_values is None:
         e_domain = sorted({e for e in rows["indx1"] if e != ""})
     else:
-        e_domain = sorted({norm(e) for e in e_values if norm(e) != ""})
+        e_domain = list(_domain(e_values))
 
     result: Dict[str, float] = {e: 1.0 for e in e_domain}
 
-    for e, value in rows[["indx1", "value"]].itertuples(index=False, name=None):
-        if e == "":
-            continue
-        v = float(value)
-        if v != 0:
-            result[e] = v
+    rows = rows[(rows["indx1"] != "") & (rows["value"] != 0)]
+    result.update(zip(rows["indx1"].tolist(), rows["value"].astype(float).tolist()))
 
     return result
 
@@ -206,22 +262,18 @@ def build_vols2(
       vols2(e)=1;
       vols2(e)$dat_o('vols2',e,'')=dat_o('vols2',e,'');
     """
-    df = _prepare_dat_o(dat_o)
+    df = _prepared(dat_o)
     rows = df[df["param"] == "vols2"]
 
     if e_values is None:
         e_domain = sorted({e for e in rows["indx1"] if e != ""})
     else:
-        e_domain = sorted({norm(e) for e in e_values if norm(e) != ""})
+        e_domain = list(_domain(e_values))
 
     result: Dict[str, float] = {e: 1.0 for e in e_domain}
 
-    for e, value in rows[["indx1", "value"]].itertuples(index=False, name=None):
-        if e == "":
-            continue
-        v = float(value)
-        if v != 0:
-            result[e] = v
+    rows = rows[(rows["indx1"] != "") & (rows["value"] != 0)]
+    result.update(zip(rows["indx1"].tolist(), rows["value"].astype(float).tolist()))
 
     return result
 
@@ -233,13 +285,13 @@ def _build_pair_param_with_global_default(
     e_values: Optional[Iterable[str]] = None,
 ) -> Dict[Tuple[str, str], float]:
     """Build pair parameter p(e,f) with GAMS-style global default fallback."""
-    df = _prepare_dat_o(dat_o)
+    df = _prepared(dat_o)
     rows = df[df["param"] == norm(param_name).lower()]
 
     if e_values is None:
         e_domain = sorted({e for e in rows["indx1"] if e != ""} | {f for f in rows["indx2"] if f != ""})
     else:
-        e_domain = sorted({norm(e) for e in e_values if norm(e) != ""})
+        e_domain = list(_domain(e_values))
 
     default_value = 0.0
     default_rows = rows[(rows["indx1"] == "") & (rows["indx2"] == "")]
@@ -247,19 +299,11 @@ def _build_pair_param_with_global_default(
         default_value = float(value)
         break
 
-    lookup: Dict[Tuple[str, str], float] = {}
-    for e, f, value in rows[["indx1", "indx2", "value"]].itertuples(index=False, name=None):
-        lookup[(e, f)] = float(value)
+    grid = _pair_grid(tuple(e_domain))
+    vals = _last_by_pair(rows).reindex(grid).fillna(0.0)
+    vals = vals.where(vals > 0, float(default_value))
 
-    result: Dict[Tuple[str, str], float] = {}
-    for e in e_domain:
-        for f in e_domain:
-            val = float(lookup.get((e, f), 0.0))
-            if val <= 0:
-                val = float(default_value)
-            result[(e, f)] = float(val)
-
-    return result
+    return dict(zip(grid.tolist(), vals.astype(float).tolist()))
 
 
 def build_c_bl(
@@ -298,7 +342,4 @@ def build_loss_max(dat_o: pd.DataFrame, default: float = 0.0) -> float:
 
     Used in GAMS efficiency expression, e.g. max(1-LossMax, ...).
     """
-    value = build_scalar_param(dat_o, "lossmax")
-    if value > 0:
-        return value
-    return float(default)
\ No newline at end of file
+    return build_all_scalars(dat_o, {"lossmax": float(default)})["lossmax"]
\ No newline at end of file
@@ -3,109 +3,83 @@ from __future__ import annotations
 from pathlib import Path
 import csv
 from datetime import datetime
+import heapq
+from itertools import product
 import json
 import math
+from operator import itemgetter
 
+import numpy as np
+import pandas as pd
 import pyomo.environ as pyo
 
 from .validate import _safe_value
 
 
-def collect_cost_breakdown(model: pyo.ConcreteModel) -> dict[str, float]:
-    z_dmd = "ZD2" if "ZD2" in model.Z else (next(iter(model.Z)) if len(model.Z) > 0 else None)
+def _sparse_var_value(var_component, idx) -> float:
+    # Slack variables are only defined on their demand support; other indices are identically zero.
+    return _safe_value(var_component[idx]) if idx in var_component else 0.0
 
-    prod_cost = 0.0
-    arc_investment_cost = 0.0
-    bidir_fixed_cost = 0.0
-    bidir_variable_cost = 0.0
-    repurpose_fixed_cost = 0.0
-    repurpose_variable_cost = 0.0
-    arc_flow_cost = 0.0
-    blending_cost = 0.0
-    regas_cost = 0.0
-    storage_cost = 0.0
-    zds_cost = 0.0
-    zn2_cost = 0.0
 
-    for n in model.N:
-        for e in model.E:
-            for y in model.Y:
-                for h in model.H:
-                    weight = _safe_value(model.r[y]) * _safe_value(model.scaleUp[h])
-                    prod_cost += weight * _safe_value(model.c_p[n, e, y]) * _safe_value(model.Q_P[n, e, y, h])
-                    regas_cost += weight * _safe_value(model.c_lr[n, e]) * _safe_value(model.Q_R[n, e, y, h])
-                    storage_cost += weight * _safe_value(model.c_we[n, e]) * _safe_value(model.Q_E[n, e, y, h])
-                    for z in model.Z:
-                        zds_cost += weight * _safe_value(model.c_z[z, e]) * _safe_value(model.ZDS[z, n, e, y, h])
-
-    for a in model.A:
-        for e in model.E:
-            for y in model.Y:
-                arc_investment_cost += (
-                    _safe_value(model.r[y])
-                    * _safe_value(model.EOH[y])
-                    * _safe_value(model.c_ax[a, e, y])
-                    * _safe_value(model.X_A[a, e, y])
-                )
+class _ParamCache:
+    # Memoized float values of a Param; Params do not change while a report is being built.
+    def __init__(self, param) -> None:
+        self.param = param
+        self.values: dict = {}
 
-    for a in model.A:
-        for y in model.Y:
-            bidir_fixed_cost += (
-                _safe_value(model.r[y])
-                * _safe_value(model.EOH[y])
-                * _safe_value(model.f_ab[a, y])
-                * _safe_value(model.B_BD[a, y])
-            )
-
-    for a in model.A:
-        for e in model.E:
-            for y in model.Y:
-                bidir_variable_cost += (
-                    _safe_value(model.r[y])
-                    * _safe_value(model.EOH[y])
-                    * _safe_value(model.c_ab[a, e, y])
-                    * _safe_value(model.K_BD[a, e, y])
-                )
+    def __getitem__(self, idx) -> float:
+        val = self.values.get(idx)
+        if val is None:
+            val = _safe_value(self.param[idx])
+            self.values[idx] = val
+        return val
 
-    for a in model.A:
-        for e in model.E:
-            for f in model.E:
-                for y in model.Y:
-                    repurpose_fixed_cost += (
-                        _safe_value(model.r[y])
-                        * _safe_value(model.EOH[y])
-                        * _safe_value(model.f_ar[a, e, f, y])
-                        * _safe_value(model.B_AR[a, e, f, y])
-                    )
-                    repurpose_variable_cost += (
-                        _safe_value(model.r[y])
-                        * _safe_value(model.EOH[y])
-                        * _safe_value(model.c_ar[a, e, f, y])
-                        * _safe_value(model.K_RA[a, e, f, y])
-                    )
-
-    for a in model.A:
-        for e in model.E:
-            for y in model.Y:
-                for h in model.H:
-                    weight = _safe_value(model.r[y]) * _safe_value(model.scaleUp[h])
-                    arc_flow_cost += weight * _safe_value(model.c_a[a, e, y]) * _safe_value(model.F_A[a, e, y, h])
-
-    for n in model.N:
-        for e in model.E:
-            for f in model.E:
-                for y in model.Y:
-                    for h in model.H:
-                        weight = _safe_value(model.r[y]) * _safe_value(model.scaleUp[h])
-                        blending_cost += weight * _safe_value(model.c_bl[e, f]) * _safe_value(model.Q_B[n, e, f, y, h])
 
+def _param_values(param) -> dict:
+    # Float value of every index of a Param (defaults included), read once.
+    return {idx: _safe_value(val) for idx, val in param.items()}
+
+
+def _weighted_var_sum(var_component, weight) -> float:
+    # The Var's own entries and their cost weights as aligned 1-D arrays, reduced with one dot product.
+    count = len(var_component)
+    values = np.fromiter((_safe_value(v) for v in var_component.values()), dtype=np.float64, count=count)
+    weights = np.fromiter((weight(idx) for idx in var_component.keys()), dtype=np.float64, count=count)
+    return float(np.dot(weights, values))
+
+
+def collect_cost_breakdown(model: pyo.ConcreteModel) -> dict[str, float]:
+    z_dmd = "ZD2" if "ZD2" in model.Z else (next(iter(model.Z)) if len(model.Z) > 0 else None)
+
+    # w[y,h] = r(y)*scaleUp(h) and r_eoh[y] = r(y)*EOH(y) are the objective weights.
+    r = _param_values(model.r)
+    scale_up = _param_values(model.scaleUp)
+    w_yh = {(y, h): r[y] * scale_up[h] for y in model.Y for h in model.H}
+    r_eoh = {y: r[y] * _safe_value(model.EOH[y]) for y in model.Y}
+    c_p, c_lr, c_we, c_a = (_param_values(p) for p in (model.c_p, model.c_lr, model.c_we, model.c_a))
+    c_ax, f_ab, c_ab = (_param_values(p) for p in (model.c_ax, model.f_ab, model.c_ab))
+    f_ar, c_ar, c_bl = (_param_values(p) for p in (model.f_ar, model.c_ar, model.c_bl))
+
+    prod_cost = _weighted_var_sum(model.Q_P, lambda i: w_yh[i[2], i[3]] * c_p[i[0], i[1], i[2]])
+    regas_cost = _weighted_var_sum(model.Q_R, lambda i: w_yh[i[2], i[3]] * c_lr[i[0], i[1]])
+    storage_cost = _weighted_var_sum(model.Q_E, lambda i: w_yh[i[2], i[3]] * c_we[i[0], i[1]])
+    arc_investment_cost = _weighted_var_sum(model.X_A, lambda i: r_eoh[i[2]] * c_ax[i])
+    bidir_fixed_cost = _weighted_var_sum(model.B_BD, lambda i: r_eoh[i[1]] * f_ab[i])
+    bidir_variable_cost = _weighted_var_sum(model.K_BD, lambda i: r_eoh[i[2]] * c_ab[i])
+    repurpose_fixed_cost = _weighted_var_sum(model.B_AR, lambda i: r_eoh[i[3]] * f_ar[i])
+    repurpose_variable_cost = _weighted_var_sum(model.K_RA, lambda i: r_eoh[i[3]] * c_ar[i])
+    arc_flow_cost = _weighted_var_sum(model.F_A, lambda i: w_yh[i[2], i[3]] * c_a[i[0], i[1], i[2]])
+    blending_cost = _weighted_var_sum(model.Q_B, lambda i: w_yh[i[3], i[4]] * c_bl[i[1], i[2]])
+
+    # ZDS and ZN2 only exist on their demand support, so they are summed over their own index.
+    c_z = _ParamCache(model.c_z)
+    zds_cost = 0.0
+    for z, n, e, y, h in model.ZDS:
+        zds_cost += w_yh[y, h] * c_z[z, e] * _safe_value(model.ZDS[z, n, e, y, h])
+    zn2_cost = 0.0
     if z_dmd is not None:
-        for g in model.NUTS2:
-            for e in model.E:
-                for y in model.Y:
-                    for h in model.H:
-                        weight = _safe_value(model.r[y]) * _safe_value(model.scaleUp[h])
-                        zn2_cost += weight * _safe_value(model.c_z[z_dmd, e]) * _safe_value(model.ZN2[g, e, y, h])
+        for g, e, y, h in model.ZN2:
+            zn2_cost += w_yh[y, h] * c_z[z_dmd, e] * _safe_value(model.ZN2[g, e, y, h])
 
     return {
         "production_cost": prod_cost,
@@ -137,105 +111,102 @@ def collect_cost_breakdown(model: pyo.ConcreteModel) -> dict[str, float]:
     }
 
 
+def _hour_totals(var_component, scale_up: _ParamCache) -> tuple[list[tuple], np.ndarray]:
+    # sum_h scaleUp[h] * value per index without h, over the Var's own entries (h is the last, fastest index):
+    # values are weighted in one array and each run of equal leading indices is summed with np.add.reduceat.
+    keys = list(var_component.keys())
+    count = len(keys)
+    values = np.fromiter((_safe_value(v) for v in var_component.values()), dtype=np.float64, count=count)
+    weights = np.fromiter((scale_up[idx[-1]] for idx in keys), dtype=np.float64, count=count)
+    starts = [pos for pos in range(count) if pos == 0 or keys[pos][:-1] != keys[pos - 1][:-1]]
+    if not starts:
+        return [], np.empty(0)
+    return [keys[pos][:-1] for pos in starts], np.add.reduceat(values * weights, starts)
+
+
 def collect_qb_totals(model: pyo.ConcreteModel, tol: float) -> list[dict[str, float | str | int]]:
+    groups, totals = _hour_totals(model.Q_B, _ParamCache(model.scaleUp))
     rows: list[dict[str, float | str | int]] = []
-    for n in model.N:
-        for f in model.E:
-            for e in model.E:
-                for y in model.Y:
-                    total = 0.0
-                    for h in model.H:
-                        total += _safe_value(model.scaleUp[h]) * _safe_value(model.Q_B[n, f, e, y, h])
-                    if abs(total) <= tol:
-                        continue
-                    rows.append({"n": str(n), "f": str(f), "e": str(e), "y": int(y), "qb_sum_h": float(total)})
-    rows.sort(key=lambda r: (str(r["n"]), str(r["f"]), str(r["e"]), int(r["y"])))
+    for pos in np.flatnonzero(~(np.abs(totals) <= tol)):
+        n, f, e, y = groups[pos]
+        rows.append({"n": str(n), "f": str(f), "e": str(e), "y": int(y), "qb_sum_h": float(totals[pos])})
+    rows.sort(key=itemgetter("n", "f", "e", "y"))
     return rows
 
 
+def _constraint_body_upper(con) -> tuple[list, np.ndarray, np.ndarray]:
+    # Indices, body values and upper bounds (inf without one) of an indexed constraint, read in one pass.
+    indices = list(con)
+    body = np.empty(len(indices), dtype=np.float64)
+    upper = np.empty(len(indices), dtype=np.float64)
+    for pos, idx in enumerate(indices):
+        con_data = con[idx]
+        body[pos] = _safe_value(con_data.body)
+        upper[pos] = _safe_value(con_data.upper) if con_data.has_ub() else math.inf
+    return indices, body, upper
+
+
 def summarize_max_bl_binding(model: pyo.ConcreteModel, tol: float) -> dict[str, object]:
     if not hasattr(model, "max_bl"):
         return {"active_constraints": 0, "binding_constraints": 0, "binding_rows": []}
 
-    active = 0
-    binding = 0
-    rows: list[dict[str, float | str | int]] = []
-    con = model.max_bl
-    for idx in con:
-        con_data = con[idx]
-        active += 1
-        body = _safe_value(con_data.body)
-        ub = _safe_value(con_data.upper) if con_data.has_ub() else math.inf
-        if math.isnan(body) or math.isnan(ub):
-            continue
-        if abs(ub - body) <= tol:
-            binding += 1
-            if len(rows) < 25:
-                rows.append({"index": str(idx), "body": body, "upper": ub})
+    indices, body, upper = _constraint_body_upper(model.max_bl)
+    with np.errstate(invalid="ignore"):
+        binding_mask = ~np.isnan(body) & ~np.isnan(upper) & (np.abs(upper - body) <= tol)
+    rows = [
+        {"index": str(indices[pos]), "body": float(body[pos]), "upper": float(upper[pos])}
+        for pos in np.flatnonzero(binding_mask)[:25]
+    ]
 
     return {
-        "active_constraints": active,
-        "binding_constraints": binding,
+        "active_constraints": len(indices),
+        "binding_constraints": int(np.count_nonzero(binding_mask)),
         "binding_rows": rows,
     }
 
 
-def collect_arc_flow_totals(model: pyo.ConcreteModel, tol: float) -> list[dict[str, float | str | int]]:
-    def _arc_endpoints(arc_id: str) -> tuple[str, str]:
-        from_node = ""
-        to_node = ""
-        for n in model.N:
-            if from_node == "" and _safe_value(model.a_s[arc_id, n]) >= 0.5:
-                from_node = str(n)
-            if to_node == "" and _safe_value(model.a_e[arc_id, n]) >= 0.5:
-                to_node = str(n)
-            if from_node and to_node:
-                break
-        return from_node, to_node
+def _arc_endpoint_map(model: pyo.ConcreteModel) -> dict[str, tuple[str, str]]:
+    # (from_node, to_node) per arc from the incidence pairs: the first start/end node in N order, "" if none.
+    n_rank = {n: idx for idx, n in enumerate(model.N)}
+    from_nodes: dict[str, str] = {}
+    to_nodes: dict[str, str] = {}
+    for nodes, pairs in ((from_nodes, model.A_S), (to_nodes, model.A_E)):
+        for a, n in pairs:
+            if a not in nodes or n_rank[n] < n_rank[nodes[a]]:
+                nodes[a] = n
+    return {a: (str(from_nodes.get(a, "")), str(to_nodes.get(a, ""))) for a in model.A}
 
+
+def collect_arc_flow_totals(model: pyo.ConcreteModel, tol: float) -> list[dict[str, float | str | int]]:
+    endpoints = _arc_endpoint_map(model)
+    groups, totals = _hour_totals(model.F_A, _ParamCache(model.scaleUp))
     rows: list[dict[str, float | str | int]] = []
-    for a in model.A:
-        from_node, to_node = _arc_endpoints(a)
-        for e in model.E:
-            for y in model.Y:
-                total = 0.0
-                for h in model.H:
-                    total += _safe_value(model.scaleUp[h]) * _safe_value(model.F_A[a, e, y, h])
-                if abs(total) <= tol:
-                    continue
-                rows.append(
-                    {
-                        "a": str(a),
-                        "e": str(e),
-                        "y": int(y),
-                        "flow_sum_h": float(total),
-                        "from_node": from_node,
-                        "to_node": to_node,
-                    }
-                )
+    for pos in np.flatnonzero(~(np.abs(totals) <= tol)):
+        a, e, y = groups[pos]
+        from_node, to_node = endpoints[a]
+        rows.append(
+            {
+                "a": str(a),
+                "e": str(e),
+                "y": int(y),
+                "flow_sum_h": float(totals[pos]),
+                "from_node": from_node,
+                "to_node": to_node,
+            }
+        )
 
-    rows.sort(key=lambda r: (str(r["a"]), str(r["e"]), int(r["y"])))
+    rows.sort(key=itemgetter("a", "e", "y"))
     return rows
 
 
 def collect_arc_expansion_totals(model: pyo.ConcreteModel, tol: float) -> list[dict[str, float | str | int]]:
-    def _arc_endpoints(arc_id: str) -> tuple[str, str]:
-        from_node = ""
-        to_node = ""
-        for n in model.N:
-            if from_node == "" and _safe_value(model.a_s[arc_id, n]) >= 0.5:
-                from_node = str(n)
-            if to_node == "" and _safe_value(model.a_e[arc_id, n]) >= 0.5:
-                to_node = str(n)
-            if from_node and to_node:
-                break
-        return from_node, to_node
-
+    endpoints = _arc_endpoint_map(model)
+    A, E, Y = list(model.A), list(model.E), list(model.Y)
     rows: list[dict[str, float | str | int]] = []
-    for a in model.A:
-        from_node, to_node = _arc_endpoints(a)
-        for e in model.E:
-            for y in model.Y:
+    for a in A:
+        from_node, to_node = endpoints[a]
+        for e in E:
+            for y in Y:
                 xa_val = _safe_value(model.X_A[a, e, y])
                 if abs(xa_val) <= tol:
                     continue
@@ -250,18 +221,19 @@ def collect_arc_expansion_totals(model: pyo.ConcreteModel, tol: float) -> list[d
                     }
                 )
 
-    rows.sort(key=lambda r: (str(r["a"]), str(r["e"]), int(r["y"])))
+    rows.sort(key=itemgetter("a", "e", "y"))
     return rows
 
 
 def collect_bidir_totals(model: pyo.ConcreteModel, tol: float) -> dict[str, list[dict[str, float | str | int]]]:
+    A, E, Y = list(model.A), list(model.E), list(model.Y)
     bd_rows: list[dict[str, float | str | int]] = []
     bbd_rows: list[dict[str, float | str | int]] = []
     kopp_rows: list[dict[str, float | str | int]] = []
     kbd_rows: list[dict[str, float | str | int]] = []
 
-    for a in model.A:
-        for y in model.Y:
+    for a in A:
+        for y in Y:
             bd_val = _safe_value(model.BD[a, y])
             bbd_val = _safe_value(model.B_BD[a, y])
             if abs(bd_val) > tol:
@@ -269,9 +241,9 @@ def collect_bidir_totals(model: pyo.ConcreteModel, tol: float) -> dict[str, list
             if abs(bbd_val) > tol:
                 bbd_rows.append({"a": str(a), "y": int(y), "B_BD": float(bbd_val)})
 
-    for a in model.A:
-        for e in model.E:
-            for y in model.Y:
+    for a in A:
+        for e in E:
+            for y in Y:
                 kopp_val = _safe_value(model.K_OPP[a, e, y])
                 kbd_val = _safe_value(model.K_BD[a, e, y])
                 if abs(kopp_val) > tol:
@@ -279,24 +251,25 @@ def collect_bidir_totals(model: pyo.ConcreteModel, tol: float) -> dict[str, list
                 if abs(kbd_val) > tol:
                     kbd_rows.append({"a": str(a), "e": str(e), "y": int(y), "K_BD": float(kbd_val)})
 
-    bd_rows.sort(key=lambda r: (str(r["a"]), int(r["y"])))
-    bbd_rows.sort(key=lambda r: (str(r["a"]), int(r["y"])))
-    kopp_rows.sort(key=lambda r: (str(r["a"]), str(r["e"]), int(r["y"])))
-    kbd_rows.sort(key=lambda r: (str(r["a"]), str(r["e"]), int(r["y"])))
+    bd_rows.sort(key=itemgetter("a", "y"))
+    bbd_rows.sort(key=itemgetter("a", "y"))
+    kopp_rows.sort(key=itemgetter("a", "e", "y"))
+    kbd_rows.sort(key=itemgetter("a", "e", "y"))
 
     return {"BD": bd_rows, "B_BD": bbd_rows, "K_OPP": kopp_rows, "K_BD": kbd_rows}
 
 
 def collect_repurpose_totals(model: pyo.ConcreteModel, tol: float) -> dict[str, list[dict[str, float | str | int]]]:
+    N, A, E, Y = list(model.N), list(model.A), list(model.E), list(model.Y)
     bar_rows: list[dict[str, float | str | int]] = []
     kra_rows: list[dict[str, float | str | int]] = []
     bwr_rows: list[dict[str, float | str | int]] = []
     krw_rows: list[dict[str, float | str | int]] = []
 
-    for a in model.A:
-        for e in model.E:
-            for f in model.E:
-                for y in model.Y:
+    for a in A:
+        for e in E:
+            for f in E:
+                for y in Y:
                     bar = _safe_value(model.B_AR[a, e, f, y])
                     kra = _safe_value(model.K_RA[a, e, f, y])
                     if abs(bar) > tol:
@@ -304,10 +277,10 @@ def collect_repurpose_totals(model: pyo.ConcreteModel, tol: float) -> dict[str,
                     if abs(kra) > tol:
                         kra_rows.append({"a": str(a), "e": str(e), "f": str(f), "y": int(y), "K_RA": float(kra)})
 
-    for n in model.N:
-        for e in model.E:
-            for f in model.E:
-                for y in model.Y:
+    for n in N:
+        for e in E:
+            for f in E:
+                for y in Y:
                     bwr = _safe_value(model.B_WR[n, e, f, y])
                     krw = _safe_value(model.K_RW[n, e, f, y])
                     if abs(bwr) > tol:
@@ -315,10 +288,10 @@ def collect_repurpose_totals(model: pyo.ConcreteModel, tol: float) -> dict[str,
                     if abs(krw) > tol:
                         krw_rows.append({"n": str(n), "e": str(e), "f": str(f), "y": int(y), "K_RW": float(krw)})
 
-    bar_rows.sort(key=lambda r: (str(r["a"]), str(r["e"]), str(r["f"]), int(r["y"])))
-    kra_rows.sort(key=lambda r: (str(r["a"]), str(r["e"]), str(r["f"]), int(r["y"])))
-    bwr_rows.sort(key=lambda r: (str(r["n"]), str(r["e"]), str(r["f"]), int(r["y"])))
-    krw_rows.sort(key=lambda r: (str(r["n"]), str(r["e"]), str(r["f"]), int(r["y"])))
+    bar_rows.sort(key=itemgetter("a", "e", "f", "y"))
+    kra_rows.sort(key=itemgetter("a", "e", "f", "y"))
+    bwr_rows.sort(key=itemgetter("n", "e", "f", "y"))
+    krw_rows.sort(key=itemgetter("n", "e", "f", "y"))
 
     return {"B_AR": bar_rows, "K_RA": kra_rows, "B_WR": bwr_rows, "K_RW": krw_rows}
 
@@ -327,188 +300,145 @@ def summarize_a_lim_binding(model: pyo.ConcreteModel, tol: float) -> dict[str, o
     if not hasattr(model, "a_lim"):
         return {"active_constraints": 0, "binding_constraints": 0, "binding_rows": []}
 
-    active = 0
-    binding = 0
-    rows: list[dict[str, float | str | int]] = []
-    con = model.a_lim
-    for idx in con:
-        con_data = con[idx]
-        active += 1
-        body = _safe_value(con_data.body)
-        ub = _safe_value(con_data.upper) if con_data.has_ub() else math.inf
-        if math.isnan(body) or math.isnan(ub) or ub <= tol:
-            continue
-        if abs(ub - body) <= tol:
-            binding += 1
-            if len(rows) < 25:
-                util = body / ub if abs(ub) > tol else math.nan
-                rows.append({"index": str(idx), "body": body, "upper": ub, "utilization": util})
+    indices, body, upper = _constraint_body_upper(model.a_lim)
+    with np.errstate(invalid="ignore"):
+        binding_mask = ~np.isnan(body) & ~np.isnan(upper) & (upper > tol) & (np.abs(upper - body) <= tol)
+    rows = []
+    for pos in np.flatnonzero(binding_mask)[:25]:
+        b, ub = float(body[pos]), float(upper[pos])
+        util = b / ub if abs(ub) > tol else math.nan
+        rows.append({"index": str(indices[pos]), "body": b, "upper": ub, "utilization": util})
 
     return {
-        "active_constraints": active,
-        "binding_constraints": binding,
+        "active_constraints": len(indices),
+        "binding_constraints": int(np.count_nonzero(binding_mask)),
         "binding_rows": rows,
     }
 
 
 def summarize_slacks(model: pyo.ConcreteModel, tol: float) -> dict[str, float]:
-    total_zds = 0.0
-    total_zn2 = 0.0
-    nz_zds = 0
-    nz_zn2 = 0
-
-    for z in model.Z:
-        for n in model.N:
-            for e in model.E:
-                for y in model.Y:
-                    for h in model.H:
-                        v = _safe_value(model.ZDS[z, n, e, y, h])
-                        total_zds += v
-                        if v > tol:
-                            nz_zds += 1
-
-    for g in model.NUTS2:
-        for e in model.E:
-            for y in model.Y:
-                for h in model.H:
-                    v = _safe_value(model.ZN2[g, e, y, h])
-                    total_zn2 += v
-                    if v > tol:
-                        nz_zn2 += 1
+    # ZDS/ZN2 are defined on their demand support only, so the arrays hold just those entries.
+    zds = np.fromiter((_safe_value(v) for v in model.ZDS.values()), dtype=np.float64, count=len(model.ZDS))
+    zn2 = np.fromiter((_safe_value(v) for v in model.ZN2.values()), dtype=np.float64, count=len(model.ZN2))
 
     return {
-        "sum_ZDS": total_zds,
-        "sum_ZN2": total_zn2,
-        "nonzero_ZDS": nz_zds,
-        "nonzero_ZN2": nz_zn2,
+        "sum_ZDS": float(zds.sum()),
+        "sum_ZN2": float(zn2.sum()),
+        "nonzero_ZDS": int(np.count_nonzero(zds > tol)),
+        "nonzero_ZN2": int(np.count_nonzero(zn2 > tol)),
     }
 
 
-def _top_nonzero_entries(var_component, tol: float, top_n: int) -> list[dict]:
-    rows: list[tuple[float, str, float]] = []
-    for idx in var_component:
-        value = _safe_value(var_component[idx])
-        if math.isnan(value) or value <= tol:
-            continue
-        rows.append((abs(value), str(idx), value))
-
-    rows.sort(key=lambda x: x[0], reverse=True)
+_RESULT_VARS = (
+    "Q_P",
+    "F_A",
+    "X_A",
+    "K_A",
+    "B_AR",
+    "K_RA",
+    "BD",
+    "B_BD",
+    "K_OPP",
+    "K_BD",
+    "K_W",
+    "B_WR",
+    "K_RW",
+    "Q_B",
+    "Q_R",
+    "Q_E",
+    "Q_I",
+    "Q_S",
+    "ZDS",
+    "ZN2",
+)
+
+
+def collect_var_values(model: pyo.ConcreteModel) -> dict[str, list[tuple]]:
+    # (index, value) pairs of every reported variable, read in one pass and shared by
+    # collect_top_variable_values and export_all_results.
+    values: dict[str, list[tuple]] = {}
+    for name in _RESULT_VARS:
+        component = getattr(model, name)
+        values[name] = [(idx, _safe_value(component[idx])) for idx in component]
+    return values
+
+
+def _top_nonzero_entries(items: list[tuple], tol: float, top_n: int) -> list[dict]:
+    nonzero = ((idx, value) for idx, value in items if not math.isnan(value) and value > tol)
+    # nlargest keeps the first-seen order among ties, like a stable descending sort.
     return [
         {
-            "index": idx,
+            "index": str(idx),
             "value": value,
         }
-        for _, idx, value in rows[:top_n]
+        for idx, value in heapq.nlargest(top_n, nonzero, key=lambda item: abs(item[1]))
     ]
 
 
-def collect_top_variable_values(model: pyo.ConcreteModel, tol: float, top_n: int) -> dict[str, list[dict]]:
-    return {
-        "Q_P": _top_nonzero_entries(model.Q_P, tol=tol, top_n=top_n),
-        "F_A": _top_nonzero_entries(model.F_A, tol=tol, top_n=top_n),
-        "X_A": _top_nonzero_entries(model.X_A, tol=tol, top_n=top_n),
-        "K_A": _top_nonzero_entries(model.K_A, tol=tol, top_n=top_n),
-        "B_AR": _top_nonzero_entries(model.B_AR, tol=tol, top_n=top_n),
-        "K_RA": _top_nonzero_entries(model.K_RA, tol=tol, top_n=top_n),
-        "BD": _top_nonzero_entries(model.BD, tol=tol, top_n=top_n),
-        "B_BD": _top_nonzero_entries(model.B_BD, tol=tol, top_n=top_n),
-        "K_OPP": _top_nonzero_entries(model.K_OPP, tol=tol, top_n=top_n),
-        "K_BD": _top_nonzero_entries(model.K_BD, tol=tol, top_n=top_n),
-        "K_W": _top_nonzero_entries(model.K_W, tol=tol, top_n=top_n),
-        "B_WR": _top_nonzero_entries(model.B_WR, tol=tol, top_n=top_n),
-        "K_RW": _top_nonzero_entries(model.K_RW, tol=tol, top_n=top_n),
-        "Q_B": _top_nonzero_entries(model.Q_B, tol=tol, top_n=top_n),
-        "Q_R": _top_nonzero_entries(model.Q_R, tol=tol, top_n=top_n),
-        "Q_E": _top_nonzero_entries(model.Q_E, tol=tol, top_n=top_n),
-        "Q_I": _top_nonzero_entries(model.Q_I, tol=tol, top_n=top_n),
-        "Q_S": _top_nonzero_entries(model.Q_S, tol=tol, top_n=top_n),
-        "ZDS": _top_nonzero_entries(model.ZDS, tol=tol, top_n=top_n),
-        "ZN2": _top_nonzero_entries(model.ZN2, tol=tol, top_n=top_n),
-    }
+def collect_top_variable_values(
+    model: pyo.ConcreteModel,
+    tol: float,
+    top_n: int,
+    *,
+    var_values: dict[str, list[tuple]] | None = None,
+) -> dict[str, list[dict]]:
+    if var_values is None:
+        var_values = collect_var_values(model)
+    return {name: _top_nonzero_entries(var_values[name], tol=tol, top_n=top_n) for name in _RESULT_VARS}
+
 
+def _write_frame_csv(frame: pd.DataFrame, output_path: Path) -> None:
+    # na_rep and lineterminator keep the csv module's output for unsolved values and line endings.
+    frame.to_csv(output_path, index=False, na_rep="nan", encoding="utf-8", lineterminator="\r\n")
 
-def _export_var_to_csv(var_component, output_path: Path) -> int:
+
+def _write_index_value_csv(indices: list[str], values: list[float], output_path: Path) -> int:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    count = 0
-    with output_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["index", "value"])
-        for idx in var_component:
-            writer.writerow([str(idx), _safe_value(var_component[idx])])
-            count += 1
-    return count
+    _write_frame_csv(pd.DataFrame({"index": indices, "value": values}), output_path)
+    return len(indices)
+
+
+def _export_var_to_csv(items: list[tuple], output_path: Path) -> int:
+    return _write_index_value_csv([str(idx) for idx, _ in items], [value for _, value in items], output_path)
 
 
 def _export_param_to_csv(param_component, output_path: Path) -> int:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    count = 0
-    with output_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["index", "value"])
-        for idx in param_component:
-            writer.writerow([str(idx), _safe_value(param_component[idx])])
-            count += 1
-    return count
+    indices = list(param_component)
+    return _write_index_value_csv(
+        [str(idx) for idx in indices], [_safe_value(param_component[idx]) for idx in indices], output_path
+    )
 
 
-def export_all_results(model: pyo.ConcreteModel, output_dir: Path) -> dict[str, dict[str, str | int]]:
+def export_all_results(
+    model: pyo.ConcreteModel,
+    output_dir: Path,
+    *,
+    var_values: dict[str, list[tuple]] | None = None,
+) -> dict[str, dict[str, str | int]]:
     output_dir.mkdir(parents=True, exist_ok=True)
-    export_spec = {
-        "Q_P": model.Q_P,
-        "F_A": model.F_A,
-        "X_A": model.X_A,
-        "K_A": model.K_A,
-        "B_AR": model.B_AR,
-        "K_RA": model.K_RA,
-        "BD": model.BD,
-        "B_BD": model.B_BD,
-        "K_OPP": model.K_OPP,
-        "K_BD": model.K_BD,
-        "K_W": model.K_W,
-        "B_WR": model.B_WR,
-        "K_RW": model.K_RW,
-        "Q_B": model.Q_B,
-        "Q_R": model.Q_R,
-        "Q_E": model.Q_E,
-        "Q_I": model.Q_I,
-        "Q_S": model.Q_S,
-        "ZDS": model.ZDS,
-        "ZN2": model.ZN2,
-    }
+    if var_values is None:
+        var_values = collect_var_values(model)
     exported: dict[str, dict[str, str | int]] = {}
-    for name, component in export_spec.items():
+    for name in _RESULT_VARS:
         out_file = output_dir / f"{name}.csv"
-        rows = _export_var_to_csv(component, out_file)
+        rows = _export_var_to_csv(var_values[name], out_file)
         exported[name] = {"file": str(out_file), "rows": rows}
 
-    cax_file = output_dir / "c_ax.csv"
-    cax_rows = _export_param_to_csv(model.c_ax, cax_file)
-    exported["c_ax"] = {"file": str(cax_file), "rows": cax_rows}
-
-    cab_file = output_dir / "c_ab.csv"
-    cab_rows = _export_param_to_csv(model.c_ab, cab_file)
-    exported["c_ab"] = {"file": str(cab_file), "rows": cab_rows}
-
-    fab_file = output_dir / "f_ab.csv"
-    fab_rows = _export_param_to_csv(model.f_ab, fab_file)
-    exported["f_ab"] = {"file": str(fab_file), "rows": fab_rows}
-
-    car_file = output_dir / "c_ar.csv"
-    car_rows = _export_param_to_csv(model.c_ar, car_file)
-    exported["c_ar"] = {"file": str(car_file), "rows": car_rows}
-
-    far_file = output_dir / "f_ar.csv"
-    far_rows = _export_param_to_csv(model.f_ar, far_file)
-    exported["f_ar"] = {"file": str(far_file), "rows": far_rows}
+    for name in ("c_ax", "c_ab", "f_ab", "c_ar", "f_ar"):
+        out_file = output_dir / f"{name}.csv"
+        rows = _export_param_to_csv(getattr(model, name), out_file)
+        exported[name] = {"file": str(out_file), "rows": rows}
 
     opp_file = output_dir / "opp_map.csv"
+    opp_rows = 0
     with opp_file.open("w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(["a", "opp_arc", "is_bid"])
         for a in model.A:
             opp_arc_val = pyo.value(model.opp_arc[a], exception=False)
             writer.writerow([str(a), "" if opp_arc_val is None else str(opp_arc_val), int(_safe_value(model.is_bid[a]))])
-    exported["opp_map"] = {"file": str(opp_file), "rows": len(list(model.A))}
+            opp_rows += 1
+    exported["opp_map"] = {"file": str(opp_file), "rows": opp_rows}
 
     return exported
 
@@ -523,8 +453,11 @@ def export_combined_results_csv(
     output_path.parent.mkdir(parents=True, exist_ok=True)
     timestamp_display = _format_timestamp_display(timestamp)
 
-    z_values = [str(z) for z in model.Z]
-    nuts2_values = [str(g) for g in model.NUTS2]
+    N, A, E, Y, H = list(model.N), list(model.A), list(model.E), list(model.Y), list(model.H)
+    Z, NUTS2 = list(model.Z), list(model.NUTS2)
+    n_in_2 = set(model.N_IN_2)
+    z_values = [str(z) for z in Z]
+    nuts2_values = [str(g) for g in NUTS2]
 
     headers = [
         "scenario",
@@ -548,61 +481,74 @@ def export_combined_results_csv(
     headers.extend([f"ZDS_{z}" for z in z_values])
     headers.extend([f"ZN2_{g}" for g in nuts2_values])
 
-    row_count = 0
-    with output_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-
-        for n in model.N:
-            for e in model.E:
-                for y in model.Y:
-                    for h in model.H:
-                        row: dict[str, float | str | int] = {
-                            "scenario": str(scenario_name),
-                            "timestamp": timestamp_display,
-                            "n": str(n),
-                            "e": str(e),
-                            "y": int(y),
-                            "h": int(h),
-                            "demand": _safe_value(model.dmd[n, e, y, h]),
-                            "Q_P": _safe_value(model.Q_P[n, e, y, h]),
-                            "Q_R": _safe_value(model.Q_R[n, e, y, h]),
-                            "Q_E": _safe_value(model.Q_E[n, e, y, h]),
-                            "Q_I": _safe_value(model.Q_I[n, e, y, h]),
-                            "Q_S": _safe_value(model.Q_S[n, e, y, h]),
-                        }
-
-                        fa_in_eff = 0.0
-                        fa_out = 0.0
-                        for a in model.A:
-                            fval = _safe_value(model.F_A[a, e, y, h])
-                            if _safe_value(model.a_e[a, n]) >= 0.5:
-                                fa_in_eff += fval * _safe_value(model.e_a[a, e])
-                            if _safe_value(model.a_s[a, n]) >= 0.5:
-                                fa_out += fval
-                        row["FA_in_eff"] = fa_in_eff
-                        row["FA_out"] = fa_out
-
-                        zds_sum = 0.0
-                        for z in model.Z:
-                            v = _safe_value(model.ZDS[z, n, e, y, h])
-                            row[f"ZDS_{z}"] = v
-                            zds_sum += v
-                        row["ZDS_sum"] = zds_sum
-
-                        zn2_assigned = 0.0
-                        zn2_total = 0.0
-                        for g in model.NUTS2:
-                            v = _safe_value(model.ZN2[g, e, y, h])
-                            row[f"ZN2_{g}"] = v
-                            zn2_total += v
-                            if _safe_value(model.n_in_2[n, g]) >= 0.5:
-                                zn2_assigned += v
-                        row["ZN2_assigned"] = zn2_assigned
-                        row["ZN2_total"] = zn2_total
-
-                        writer.writerow(row)
-                        row_count += 1
+    # Arc flows are read once per (a, e, y, h) and scattered onto the arc's start/end nodes.
+    start_nodes: dict[str, list[str]] = {a: [] for a in A}
+    end_nodes: dict[str, list[str]] = {a: [] for a in A}
+    for a, n in model.A_S:
+        start_nodes[a].append(n)
+    for a, n in model.A_E:
+        end_nodes[a].append(n)
+    fa_in_eff: dict[tuple, float] = {}
+    fa_out: dict[tuple, float] = {}
+    for a in A:
+        for e in E:
+            eff = _safe_value(model.e_a[a, e])
+            for y in Y:
+                for h in H:
+                    fval = _safe_value(model.F_A[a, e, y, h])
+                    for n in end_nodes[a]:
+                        fa_in_eff[n, e, y, h] = fa_in_eff.get((n, e, y, h), 0.0) + fval * eff
+                    for n in start_nodes[a]:
+                        fa_out[n, e, y, h] = fa_out.get((n, e, y, h), 0.0) + fval
+
+    # Columns are filled in one pass over N x E x Y x H and written in a single to_csv call.
+    columns: dict[str, list | np.ndarray] = {name: [] for name in headers}
+    for n in N:
+        for e in E:
+            for y in Y:
+                for h in H:
+                    columns["n"].append(str(n))
+                    columns["e"].append(str(e))
+                    columns["y"].append(int(y))
+                    columns["h"].append(int(h))
+                    columns["demand"].append(_safe_value(model.dmd[n, e, y, h]))
+                    columns["Q_P"].append(_safe_value(model.Q_P[n, e, y, h]))
+                    columns["Q_R"].append(_safe_value(model.Q_R[n, e, y, h]))
+                    columns["Q_E"].append(_safe_value(model.Q_E[n, e, y, h]))
+                    columns["Q_I"].append(_safe_value(model.Q_I[n, e, y, h]))
+                    columns["Q_S"].append(_safe_value(model.Q_S[n, e, y, h]))
+
+                    columns["FA_in_eff"].append(fa_in_eff.get((n, e, y, h), 0.0))
+                    columns["FA_out"].append(fa_out.get((n, e, y, h), 0.0))
+
+                    zds_sum = 0.0
+                    for z in Z:
+                        v = _sparse_var_value(model.ZDS, (z, n, e, y, h))
+                        columns[f"ZDS_{z}"].append(v)
+                        zds_sum += v
+                    columns["ZDS_sum"].append(zds_sum)
+
+    # ZN2 does not depend on n: read it once as (g, e*y*h) and spread it over the node rows.
+    # Sums over g are accumulated one region at a time, in NUTS2 order.
+    zn2 = np.fromiter(
+        (_sparse_var_value(model.ZN2, idx) for idx in product(NUTS2, E, Y, H)),
+        dtype=np.float64,
+        count=len(NUTS2) * len(E) * len(Y) * len(H),
+    ).reshape(len(NUTS2), len(E) * len(Y) * len(H))
+    member = np.array([[(n, g) in n_in_2 for g in NUTS2] for n in N], dtype=bool).reshape(len(N), len(NUTS2))
+    zn2_assigned = np.zeros((len(N), zn2.shape[1]))
+    zn2_total = np.zeros(zn2.shape[1])
+    for j, g in enumerate(NUTS2):
+        columns[f"ZN2_{g}"] = np.tile(zn2[j], len(N))
+        zn2_total += zn2[j]
+        zn2_assigned += np.where(member[:, j, None], zn2[j], 0.0)
+    columns["ZN2_assigned"] = zn2_assigned.ravel()
+    columns["ZN2_total"] = np.tile(zn2_total, len(N))
+
+    row_count = len(columns["n"])
+    columns["scenario"] = [str(scenario_name)] * row_count
+    columns["timestamp"] = [timestamp_display] * row_count
+    _write_frame_csv(pd.DataFrame(columns, columns=headers), output_path)
 
     return {"file": str(output_path), "rows": row_count}
 
@@ -633,7 +579,24 @@ def write_per_run_result_csvs(
     timestamp_display = _format_timestamp_display(timestamp)
     summary_path = scenario_dir / f"summary_{scenario_name}_{timestamp}.csv"
 
-    rows: list[dict[str, str | float | int]] = []
+    header = [
+        "scenario",
+        "timestamp",
+        "section",
+        "metric",
+        "value",
+        "node",
+        "arc",
+        "from_node",
+        "to_node",
+        "carrier",
+        "year",
+        "hour",
+        "z",
+        "nuts2",
+    ]
+    scenario_str = str(scenario_name)
+    rows: list[tuple] = []
 
     def add_row(
         *,
@@ -650,24 +613,8 @@ def write_per_run_result_csvs(
         z: str = "",
         nuts2: str = "",
     ) -> None:
-        rows.append(
-            {
-                "scenario": str(scenario_name),
-                "timestamp": timestamp_display,
-                "section": str(section),
-                "metric": str(metric),
-                "value": float(value),
-                "node": str(node),
-                "arc": str(arc),
-                "from_node": str(from_node),
-                "to_node": str(to_node),
-                "carrier": str(carrier),
-                "year": str(year),
-                "hour": str(hour),
-                "z": str(z),
-                "nuts2": str(nuts2),
-            }
-        )
+        # Positional in header order; callers already pass strings for the optional fields.
+        rows.append((scenario_str, timestamp_display, section, metric, float(value), node, arc, from_node, to_node, carrier, year, hour, z, nuts2))
 
     for key, value in report.get("cost_breakdown", {}).items():
         add_row(section="cost_breakdown", metric=str(key), value=float(value))
@@ -772,26 +719,8 @@ def write_per_run_result_csvs(
                 )
 
     with summary_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "scenario",
-                "timestamp",
-                "section",
-                "metric",
-                "value",
-                "node",
-                "arc",
-                "from_node",
-                "to_node",
-                "carrier",
-                "year",
-                "hour",
-                "z",
-                "nuts2",
-            ],
-        )
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(header)
         writer.writerows(rows)
 
     return {"summary": str(summary_path), "rows": str(len(rows))}
@@ -18,6 +18,7 @@ from .report import (
     collect_qb_totals,
     collect_repurpose_totals,
     collect_top_variable_values,
+    collect_var_values,
     export_all_results,
     export_combined_results_csv,
     summarize_a_lim_binding,
@@ -157,7 +158,8 @@ def main() -> None:
     con_report = validate_constraints(model, tol=effective_tol)
     cost_report = collect_cost_breakdown(model)
     slack_report = summarize_slacks(model, tol=effective_tol)
-    top_vars = collect_top_variable_values(model, tol=effective_tol, top_n=max(1, args.top_n))
+    var_values = collect_var_values(model)
+    top_vars = collect_top_variable_values(model, tol=effective_tol, top_n=max(1, args.top_n), var_values=var_values)
     arc_flow_totals = collect_arc_flow_totals(model, tol=effective_tol)
     arc_expansion_totals = collect_arc_expansion_totals(model, tol=effective_tol)
     bidir_totals = collect_bidir_totals(model, tol=effective_tol)
@@ -197,7 +199,7 @@ def main() -> None:
     export_all_requested = bool(args.export_all_dir)
     if export_all_requested:
         export_dir = (scenario_dir / f"all_results_{run_timestamp}").resolve()
-        report["all_variable_exports"] = export_all_results(model, export_dir)
+        report["all_variable_exports"] = export_all_results(model, export_dir, var_values=var_values)
 
     report["operations_csv_export_default"] = export_combined_results_csv(
         model,
@@ -68,7 +68,7 @@ def validate_bidirectional_logic(model: pyo.ConcreteModel, tol: float) -> dict[s
     is_bid_violations: list[dict[str, float | str | int]] = []
 
     for a in model.A:
-        has_opp = any(_safe_value(model.opp[ao, a]) >= 0.5 for ao in model.A)
+        has_opp = any((ao, a) in model.OPP_PAIRS for ao in model.A)
         for e in model.E:
             for y in model.Y:
                 kopp = _safe_value(model.K_OPP[a, e, y])
@@ -80,10 +80,7 @@ def validate_bidirectional_logic(model: pyo.ConcreteModel, tol: float) -> dict[s
                 if abs(bd) <= tol and abs(kopp) > tol:
                     bd_zero_violations.append({"a": str(a), "e": str(e), "y": int(y), "BD": bd, "K_OPP": kopp})
 
-                opp_cap = sum(
-                    _safe_value(model.opp[ao, a]) * _safe_value(model.K_A[ao, e, y])
-                    for ao in model.A
-                )
+                opp_cap = sum(_safe_value(model.K_A[ao, e, y]) for ao in model.A if (ao, a) in model.OPP_PAIRS)
                 if kopp - opp_cap > tol:
                     opp_cap_violations.append(
                         {"a": str(a), "e": str(e), "y": int(y), "K_OPP": kopp, "opp_cap": opp_cap, "diff": kopp - opp_cap}
@@ -115,6 +112,8 @@ def validate_repurposing_logic(model: pyo.ConcreteModel, tol: float) -> dict[str
     bil_w2_viol: list[dict[str, float | str | int]] = []
 
     first_y = min(int(y) for y in model.Y) if len(list(model.Y)) > 0 else None
+    y_order = list(model.Y)
+    y_prev = dict(zip(y_order[1:], y_order))
 
     for a in model.A:
         for e in model.E:
@@ -124,14 +123,12 @@ def validate_repurposing_logic(model: pyo.ConcreteModel, tol: float) -> dict[str
                     continue
 
                 lhs_ar = _safe_value(model.K_A[a, e, y])
-                rhs_ar = sum(_safe_value(model.K_RA[a, f, e, y]) for f in model.E) + sum(
-                    _safe_value(model.X_A[a, e, y2]) for y2 in model.Y if _safe_value(model.ypred[y2, y]) >= 0.5
-                )
+                rhs_ar = sum(_safe_value(model.K_RA[a, f, e, y]) for f in model.E) + _safe_value(model.X_A[a, e, y_prev[y]])
                 if abs(lhs_ar - rhs_ar) > tol:
                     ar_cap_viol.append({"a": str(a), "e": str(e), "y": yi, "lhs": lhs_ar, "rhs": rhs_ar, "residual": lhs_ar - rhs_ar})
 
                 lhs_ba1 = sum(_safe_value(model.K_RA[a, e, f, y]) for f in model.E)
-                rhs_ba1 = sum(_safe_value(model.K_A[a, e, y2]) for y2 in model.Y if _safe_value(model.ypred[y2, y]) >= 0.5)
+                rhs_ba1 = _safe_value(model.K_A[a, e, y_prev[y]])
                 if abs(lhs_ba1 - rhs_ba1) > tol:
                     bil_a1_viol.append({"a": str(a), "e": str(e), "y": yi, "lhs": lhs_ba1, "rhs": rhs_ba1, "residual": lhs_ba1 - rhs_ba1})
 
@@ -141,7 +138,7 @@ def validate_repurposing_logic(model: pyo.ConcreteModel, tol: float) -> dict[str
 
                 for f in model.E:
                     lhs_ba2 = _safe_value(model.K_RA[a, e, f, y])
-                    rhs_ba2 = _safe_value(model.B_AR[a, e, f, y]) * _safe_value(model.bigM)
+                    rhs_ba2 = _safe_value(model.B_AR[a, e, f, y]) * _safe_value(model.bigM_ar[a, e, y])
                     if lhs_ba2 - rhs_ba2 > tol:
                         bil_a2_viol.append({"a": str(a), "e": str(e), "f": str(f), "y": yi, "lhs": lhs_ba2, "rhs": rhs_ba2, "diff": lhs_ba2 - rhs_ba2})
 
@@ -158,7 +155,7 @@ def validate_repurposing_logic(model: pyo.ConcreteModel, tol: float) -> dict[str
                     wr_cap_viol.append({"n": str(n), "e": str(e), "y": yi, "lhs": lhs_wr, "rhs": rhs_wr, "residual": lhs_wr - rhs_wr})
 
                 lhs_bw1 = sum(_safe_value(model.K_RW[n, e, f, y]) for f in model.E)
-                rhs_bw1 = sum(_safe_value(model.K_W[n, e, y2]) for y2 in model.Y if _safe_value(model.ypred[y2, y]) >= 0.5)
+                rhs_bw1 = _safe_value(model.K_W[n, e, y_prev[y]])
                 if abs(lhs_bw1 - rhs_bw1) > tol:
                     bil_w1_viol.append({"n": str(n), "e": str(e), "y": yi, "lhs": lhs_bw1, "rhs": rhs_bw1, "residual": lhs_bw1 - rhs_bw1})
 
@@ -168,7 +165,7 @@ def validate_repurposing_logic(model: pyo.ConcreteModel, tol: float) -> dict[str
 
                 for f in model.E:
                     lhs_bw2 = _safe_value(model.K_RW[n, e, f, y])
-                    rhs_bw2 = _safe_value(model.B_WR[n, e, f, y]) * _safe_value(model.bigM)
+                    rhs_bw2 = _safe_value(model.B_WR[n, e, f, y]) * _safe_value(model.bigM_wr[n])
                     if lhs_bw2 - rhs_bw2 > tol:
                         bil_w2_viol.append({"n": str(n), "e": str(e), "f": str(f), "y": yi, "lhs": lhs_bw2, "rhs": rhs_bw2, "diff": lhs_bw2 - rhs_bw2})
 
@@ -210,12 +207,12 @@ def validate_node_arc_balance(model: pyo.ConcreteModel, tol: float) -> dict[str,
                     inflow_eff = sum(
                         _safe_value(model.F_A[a, e, y, h]) * _safe_value(model.e_a[a, e])
                         for a in model.A
-                        if _safe_value(model.a_e[a, n]) >= 0.5
+                        if (a, n) in model.A_E
                     )
                     outflow = sum(
                         _safe_value(model.F_A[a, e, y, h])
                         for a in model.A
-                        if _safe_value(model.a_s[a, n]) >= 0.5
+                        if (a, n) in model.A_S
                     )
                     blend_in = 0.0
                     if hasattr(model, "Q_B"):
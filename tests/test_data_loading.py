@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from scr.core.data_loading import _as_categories, clear_input_cache, load_inputs, load_nodes_csv
+
+
+NODES_CSV = "n,cn,nuts2\nMünchen,DE,DE21\nBerlin,DE,DE30\n"
+
+
+def test_load_nodes_csv_reads_utf8_labels_as_str(tmp_path: Path) -> None:
+    path = tmp_path / "nodes.csv"
+    path.write_bytes(NODES_CSV.encode("utf-8"))
+
+    df = load_nodes_csv(path)
+
+    assert df["n"].astype(str).tolist() == ["München", "Berlin"]
+
+
+def test_load_nodes_csv_rejects_cp1252_input(tmp_path: Path) -> None:
+    path = tmp_path / "nodes.csv"
+    path.write_bytes(NODES_CSV.encode("cp1252"))
+
+    with pytest.raises(UnicodeDecodeError):
+        load_nodes_csv(path)
+
+
+def test_as_categories_rejects_non_text_labels() -> None:
+    df = pd.DataFrame({"n": ["Berlin", b"M\xfcnchen", None]})
+
+    with pytest.raises(ValueError, match="column 'n' of nodes.csv"):
+        _as_categories(df, ["n"], Path("nodes.csv"))
+
+
+def test_load_inputs_cache_returns_independent_copies() -> None:
+    other = Path(__file__).resolve().parents[1] / "data" / "demo01_base_flow" / "other.csv"
+    clear_input_cache()
+    first = load_inputs(other_path=other, use_cache=True)
+    first["dat_o"].loc[:, "value"] = -1.0
+    first["dmd"].clear()
+
+    second = load_inputs(other_path=other, use_cache=True)
+
+    assert (second["dat_o"]["value"] != -1.0).any()
+    assert second["dmd"]
+    assert second["dat_o"] is not first["dat_o"]